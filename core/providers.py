@@ -298,6 +298,10 @@ def handle_rate_limit(provider: str) -> bool:
     return False
 
 
+# OpenAI uyumlu provider'lar - key, LLM nesnesi yeniden oluşturulmadan değiştirilebilir
+_REBINDABLE_PROVIDERS = ("openai", "openrouter", "cerebras", "xai", "together")
+
+
 def check_api_key(provider: str) -> bool:
     if provider == "ollama":
         return True
@@ -685,6 +689,44 @@ class ModelManager:
         
         logger.info(f"Reset to primary provider: {role or 'all'}")
     
+    def rebind_api_key(self, role: str, new_key: str = None) -> bool:
+        """
+        Swap the API key of the cached LLM in place, without rebuilding it.
+        The agent graph keeps a reference to the same LLM object, so after a
+        key rotation there is no need to call get_agent_executor() again.
+        Returns False if the LLM must be recreated instead.
+        """
+        llm = self._llm_cache.get(role)
+        if llm is None:
+            return False
+        
+        provider, _ = self.get_current_provider_info(role)
+        if provider not in _REBINDABLE_PROVIDERS:
+            return False
+        
+        if new_key is None:
+            new_key = get_api_key(provider)
+        if not new_key:
+            return False
+        
+        try:
+            from langchain_core.utils import convert_to_secret_str
+            # openai SDK client'ları key'i her istekte kendi alanından okur;
+            # biri yoksa LLM'i yarım bırakmadan yeniden oluşturulmasını iste
+            clients = [getattr(llm, attr, None) for attr in ("root_client", "root_async_client")]
+            if None in clients:
+                return False
+            
+            llm.openai_api_key = convert_to_secret_str(new_key)
+            for client in clients:
+                client.api_key = new_key
+        except Exception as e:
+            logger.warning(f"Could not rebind API key for {role}: {e}")
+            return False
+        
+        logger.info(f"API key rebound in place for {role} ({provider})")
+        return True
+    
     def get_config(self, role: str) -> Optional[AgentModelConfig]:
         return self.configs.get(role)
     
@@ -96,3 +96,49 @@ class TestRateLimitDetection:
         # Should not detect as rate limit
         assert not is_rate_limit_error(Exception("Connection error"))
         assert not is_rate_limit_error(Exception("Invalid API key"))
+
+
+class TestRebindApiKey:
+    """Test in-place API key rebinding"""
+    
+    def test_rebind_openai_client(self):
+        """Test key is swapped on the cached LLM and its clients"""
+        from core.providers import ModelManager
+        
+        manager = ModelManager()
+        manager.configs["supervisor"].provider = "openai"
+        manager._current_provider["supervisor"] = 0
+        llm = MagicMock()
+        manager._llm_cache["supervisor"] = llm
+        
+        assert manager.rebind_api_key("supervisor", "new_key") == True
+        assert llm.openai_api_key.get_secret_value() == "new_key"
+        assert llm.root_client.api_key == "new_key"
+        assert llm.root_async_client.api_key == "new_key"
+        assert manager._llm_cache["supervisor"] is llm
+    
+    def test_rebind_without_clients_leaves_llm_untouched(self):
+        """Test an LLM without SDK clients is not half rebound"""
+        from core.providers import ModelManager
+        
+        manager = ModelManager()
+        manager.configs["supervisor"].provider = "openai"
+        manager._current_provider["supervisor"] = 0
+        llm = MagicMock(spec=["openai_api_key"])
+        llm.openai_api_key = "old_key"
+        manager._llm_cache["supervisor"] = llm
+        
+        assert manager.rebind_api_key("supervisor", "new_key") == False
+        assert llm.openai_api_key == "old_key"
+    
+    def test_rebind_requires_rebuild(self):
+        """Test non-rebindable providers and empty cache return False"""
+        from core.providers import ModelManager
+        
+        manager = ModelManager()
+        assert manager.rebind_api_key("supervisor", "new_key") == False
+        
+        manager.configs["supervisor"].provider = "ollama"
+        manager._current_provider["supervisor"] = 0
+        manager._llm_cache["supervisor"] = MagicMock()
+        assert manager.rebind_api_key("supervisor", "new_key") == False
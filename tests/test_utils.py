@@ -157,3 +157,66 @@ class TestContextManager:
         truncated = manager.truncate_tool_output(long, max_tokens=100)
         assert len(truncated) < len(long)
         assert "truncated" in truncated.lower()
+
+
+class TestSettingsStore:
+    """Test cached settings file access"""
+    
+    def test_roundtrip_and_cache(self, temp_workspace):
+        """Saved data is read back from cache until the file changes"""
+        import os
+        from ui import settings_store
+        
+        path = os.path.join(temp_workspace, "settings.json")
+        assert settings_store._load_json(path) == {}
+        
+        settings_store._save_json(path, {"models": {"coder": {"model": "a"}}})
+        first = settings_store._load_json(path)
+        assert first == {"models": {"coder": {"model": "a"}}}
+        assert settings_store._load_json(path) is first
+        assert not os.path.exists(path + ".tmp")
+    
+    def test_unchanged_save_skips_write(self, temp_workspace):
+        """Saving identical content leaves the file untouched"""
+        import os
+        from ui import settings_store
+        
+        path = os.path.join(temp_workspace, "settings.json")
+        settings_store._save_json(path, {"a": 1})
+        mtime = os.stat(path).st_mtime_ns
+        
+        time.sleep(0.01)
+        settings_store._save_json(path, {"a": 1})
+        assert os.stat(path).st_mtime_ns == mtime
+        
+        settings_store._save_json(path, {"a": 2})
+        assert settings_store._load_json(path) == {"a": 2}
+
+
+class TestFileButtons:
+    """Test editor toolbar buttons of the app"""
+    
+    def _press(self, button_id: str):
+        import asyncio
+        from unittest.mock import AsyncMock
+        from textual.widgets import Button
+        from ui.app import AtomAgentApp
+        
+        app = MagicMock()
+        app.action_save_file = AsyncMock()
+        app.action_run_file = AsyncMock()
+        event = Button.Pressed(Button("x", id=button_id))
+        asyncio.run(AtomAgentApp.on_button_pressed(app, event))
+        return app
+    
+    def test_save_button_awaits_save(self):
+        """Save button runs the async save action"""
+        app = self._press("btn-save-file")
+        app.action_save_file.assert_awaited_once()
+        app.action_run_file.assert_not_called()
+    
+    def test_run_button_awaits_run(self):
+        """Run button runs the async run action"""
+        app = self._press("btn-run-file")
+        app.action_run_file.assert_awaited_once()
+        app.action_save_file.assert_not_called()
@@ -6,6 +6,7 @@ import subprocess
 import os
 import time
 import threading
+from collections import deque
 from datetime import datetime
 from typing import Optional, List, Callable
 from langchain_core.tools import tool
@@ -19,9 +20,10 @@ SHARED_DIR = os.path.join(DOCKER_DIR, "shared")
 CONTAINER_NAME = "atomagent-sandbox"
 
 # Terminal history - UI'da göstermek için
-_terminal_history: List[dict] = []
-_history_callbacks: List[Callable] = []
+# (deque maxlen ile en eski giriş O(1) düşer)
 _max_history = 100
+_terminal_history: deque = deque(maxlen=_max_history)
+_history_callbacks: List[Callable] = []
 
 
 def _add_to_history(entry_type: str, content: str, exit_code: int = None):
@@ -34,10 +36,6 @@ def _add_to_history(entry_type: str, content: str, exit_code: int = None):
     }
     _terminal_history.append(entry)
     
-    # Max history limit
-    if len(_terminal_history) > _max_history:
-        _terminal_history.pop(0)
-    
     # Callback'leri çağır (UI güncellemesi için)
     for callback in _history_callbacks:
         try:
@@ -59,7 +57,7 @@ def unregister_terminal_callback(callback: Callable):
 
 def get_terminal_history() -> List[dict]:
     """Terminal geçmişini döndür"""
-    return _terminal_history.copy()
+    return list(_terminal_history)
 
 
 def clear_terminal_history():
@@ -363,6 +361,7 @@ def sandbox_list_files(path: str = "/") -> str:
     
     Returns:
         JSON string: [{"name": "...", "is_dir": true/false, "size": ...}, ...]
+        (klasörler önce, ardından dosyalar; her grup isme göre sıralı)
     """
     if not _is_container_running():
         return "[]"
@@ -389,6 +388,8 @@ try:
                 }})
             except:
                 pass
+    # Klasörler önce, sonra dosyalar (isme göre); UI sıralamadan ekler
+    items.sort(key=lambda x: (not x["is_dir"], x["name"].lower()))
     print(json.dumps(items))
 except Exception as e:
     print(json.dumps([]))
@@ -434,32 +434,32 @@ class AtomAgentApp(App):
             import pyperclip
             pyperclip.copy(text)
             self.notify("📋 Panoya kopyalandı", severity="information", timeout=2)
+            return
         except ImportError:
-            # pyperclip yoksa xclip/xsel dene (Linux)
+            pass
+        
+        # pyperclip yoksa xclip/xsel dene (Linux)
+        import subprocess
+        for cmd in (['xclip', '-selection', 'clipboard'], ['xsel', '--clipboard', '--input']):
             try:
-                import subprocess
-                process = subprocess.Popen(['xclip', '-selection', 'clipboard'], 
-                                          stdin=subprocess.PIPE)
+                process = subprocess.Popen(cmd, stdin=subprocess.PIPE)
                 process.communicate(text.encode('utf-8'))
                 self.notify("📋 Panoya kopyalandı", severity="information", timeout=2)
-            except:
-                try:
-                    import subprocess
-                    process = subprocess.Popen(['xsel', '--clipboard', '--input'], 
-                                              stdin=subprocess.PIPE)
-                    process.communicate(text.encode('utf-8'))
-                    self.notify("📋 Panoya kopyalandı", severity="information", timeout=2)
-                except:
-                    # Hiçbiri çalışmazsa dosyaya yaz
-                    with open("/tmp/atomagent_clipboard.txt", "w") as f:
-                        f.write(text)
-                    self.notify("📋 /tmp/atomagent_clipboard.txt dosyasına kaydedildi", 
-                               severity="information", timeout=3)
+                return
+            except OSError:
+                continue
+        
+        # Hiçbiri çalışmazsa dosyaya yaz
+        with open("/tmp/atomagent_clipboard.txt", "w") as f:
+            f.write(text)
+        self.notify("📋 /tmp/atomagent_clipboard.txt dosyasına kaydedildi", 
+                   severity="information", timeout=3)
 
     def _update_status(self, text: str, color: str = "white"):
-        try:
-            self.query_one("#status-bar", Static).update(f"[{color}]{text}[/{color}]")
-        except:
+        status_bars = self.query("#status-bar")
+        if status_bars:
+            status_bars.first(Static).update(f"[{color}]{text}[/{color}]")
+        else:
             # Permission dialog açıkken status-bar yok, yeni oluştur
             status_container = self.query_one("#status-container")
             status_container.remove_children()
@@ -511,11 +511,11 @@ class AtomAgentApp(App):
             return
 
         if event.button.id == "btn-save-file":
-            self.action_save_file()
+            await self.action_save_file()
             return
             
         if event.button.id == "btn-run-file":
-            self.action_run_file()
+            await self.action_run_file()
             return
         
         if event.button.id == "btn-stop":
@@ -560,16 +560,16 @@ class AtomAgentApp(App):
         
     # === FILE ACTIONS ===
 
-    def on_directory_tree_file_selected(self, event: DirectoryTree.FileSelected) -> None:
+    async def on_directory_tree_file_selected(self, event: DirectoryTree.FileSelected) -> None:
         event.stop()
-        self.file_handler.open_file(str(event.path))
+        await self.file_handler.open_file(str(event.path))
 
-    def action_save_file(self) -> None:
-        self.file_handler.save_file()
+    async def action_save_file(self) -> None:
+        await self.file_handler.save_file()
 
-    def action_run_file(self) -> None:
+    async def action_run_file(self) -> None:
         dashboard = self.query_one("#dashboard-view")
-        self.file_handler.run_file(dashboard)
+        await self.file_handler.run_file(dashboard)
 
     # === APP ACTIONS ===
 
@@ -1012,7 +1012,7 @@ class AtomAgentApp(App):
         chat.mount(Static("\n".join(lines), classes="system-msg"))
 
     async def _run_agent(self, user_input: str, retry_count: int = 0):
-        from core.providers import is_rate_limit_error, is_fallback_needed, handle_rate_limit
+        from core.providers import is_rate_limit_error, is_fallback_needed, handle_rate_limit, get_api_key
         from tools.agents import clear_agent_cache
         from tools.memory import get_persistent_context
         
@@ -1099,10 +1099,11 @@ class AtomAgentApp(App):
                         dashboard, self.loading_widgets, self.tool_handler
                     )
                     # Debug: Tool bitti
+                    lowered = output.lower()
                     if self.tool_activity:
-                        status = "error" if "error" in output.lower() or "hata" in output.lower() else "success"
+                        status = "error" if "error" in lowered or "hata" in lowered else "success"
                         self.tool_activity.update_activity(tool_name, status)
-                    self._log_debug("success" if "error" not in output.lower() else "warning", f"Tool bitti: {tool_name}")
+                    self._log_debug("success" if "error" not in lowered else "warning", f"Tool bitti: {tool_name}")
 
             self.chat_handler.finalize_response(final_text, ai_response)
             self._last_ai_response = final_text  # Son yanıtı sakla
@@ -1204,9 +1205,23 @@ class AtomAgentApp(App):
                     self.notify(f"🔄 API key değiştirildi ({retry_count + 1}/{max_retries})", severity="warning", timeout=2)
                     self._show_api_key_status()
                     
-                    model_manager.clear_cache()
-                    clear_agent_cache()
-                    self.agent_executor, _, self.system_prompt = get_agent_executor()
+                    # Sadece key değişti - mümkünse LLM'leri yerinde güncelle, agent'ı yeniden kurma
+                    new_key = get_api_key(provider)
+                    rebound = (
+                        model_manager.get_current_provider_info("supervisor")[0] == provider
+                        and model_manager.rebind_api_key("supervisor", new_key)
+                    )
+                    for role in ("coder", "researcher"):
+                        if model_manager.get_current_provider_info(role)[0] != provider:
+                            continue
+                        if not model_manager.rebind_api_key(role, new_key):
+                            model_manager.clear_cache(role)
+                            clear_agent_cache()
+                    
+                    if not rebound:
+                        model_manager.clear_cache()
+                        clear_agent_cache()
+                        self.agent_executor, _, self.system_prompt = get_agent_executor()
                     
                     await ai_response.remove()
                     self.run_worker(self._run_agent(user_input, retry_count + 1), exclusive=True)
@@ -9,16 +9,23 @@ from langchain_core.messages import HumanMessage, SystemMessage
 
 from utils.logger import get_logger
 from ui.widgets.code_highlighter import parse_message_with_code, simple_highlight, detect_language
+from ui.handlers.tool_handlers import PERMISSION_RE
 import re
 
 logger = get_logger()
 
+# Kod bloğu pattern'i; code_highlighter'dakinden farklı olarak dil satırından
+# sonraki newline opsiyonel (```kod``` tek satırda da yakalanır)
+_CODE_BLOCK_RE = re.compile(r"```(\w*)\n?(.*?)```", re.DOTALL)
+
 
 class ChatHandler:
     """Chat ve agent iletişimini yöneten sınıf"""
     
     def __init__(self, app):
         self.app = app
+        # dashboard -> mount edilmeyi bekleyen loading widget'ları
+        self._pending_mounts: dict = {}
     
     def get_timestamp(self) -> str:
         """Zaman damgası döndür"""
@@ -78,11 +85,8 @@ class ChatHandler:
         """Mesajdaki kod bloklarını renklendir"""
         result = Text()
         
-        # Kod bloğu pattern'i
-        code_block_pattern = r"```(\w*)\n?(.*?)```"
-        
         last_end = 0
-        for match in re.finditer(code_block_pattern, message, re.DOTALL):
+        for match in _CODE_BLOCK_RE.finditer(message):
             # Kod bloğundan önceki text
             if match.start() > last_end:
                 result.append(message[last_end:match.start()])
@@ -121,28 +125,38 @@ class ChatHandler:
         
         loading = Static(f"[yellow]⚙️ {tool_name}...[/yellow]", classes="loading-card")
         loading_widgets[run_id] = loading
-        await dashboard.mount(loading)
+        
+        # Paralel tool'lar tek layout pass'te mount edilsin
+        if not self._pending_mounts:
+            self.app.call_later(self._drain_mounts)
+        self._pending_mounts.setdefault(dashboard, []).append(loading)
+    
+    def _drain_mounts(self) -> None:
+        """Bekleyen loading widget'larını dashboard başına tek seferde mount et"""
+        pending, self._pending_mounts = self._pending_mounts, {}
+        for dashboard, widgets in pending.items():
+            if widgets:
+                dashboard.mount(*widgets)
     
     async def handle_tool_end(self, tool_name: str, run_id: str, output: str,
                                dashboard, loading_widgets: dict,
                                tool_handler) -> bool:
         """Tool bitişini işle. Permission gerekiyorsa True döner."""
-        # Loading widget'ı kaldır
-        if run_id in loading_widgets:
-            await loading_widgets[run_id].remove()
-            del loading_widgets[run_id]
+        # Loading widget'ı kaldır (henüz mount edilmediyse kuyruktan çıkar)
+        loading = loading_widgets.pop(run_id, None)
+        if loading is not None:
+            pending = self._pending_mounts.get(dashboard)
+            if pending and loading in pending:
+                pending.remove(loading)
+            else:
+                loading.remove()
         
         # Permission kontrolü (emoji ile veya emoji olmadan)
-        if "PERMISSION_REQUIRED:" in output:
-            # "⚠️ PERMISSION_REQUIRED:cmd:full_cmd" formatını parse et
-            perm_idx = output.find("PERMISSION_REQUIRED:")
-            perm_part = output[perm_idx:]  # "PERMISSION_REQUIRED:cmd:full_cmd"
-            parts = perm_part.split(":")
-            if len(parts) >= 3:
-                base_cmd = parts[1]
-                full_cmd = ":".join(parts[2:])
-                await self.app._show_permission_dialog(base_cmd, full_cmd)
-                return True
+        perm_match = PERMISSION_RE.search(output)
+        if perm_match:
+            base_cmd, full_cmd = perm_match.groups()
+            await self.app._show_permission_dialog(base_cmd, full_cmd)
+            return True
         
         # Tool çıktısını işle
         await tool_handler.handle(tool_name, output, dashboard)
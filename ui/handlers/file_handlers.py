@@ -2,11 +2,14 @@
 File Handlers - Dosya işlemleri (açma, kaydetme, çalıştırma)
 """
 import os
-import subprocess
-from textual.widgets import DirectoryTree, TextArea, Label, TabbedContent, Static
+import sys
+import asyncio
+import tempfile
+from textual.widgets import DirectoryTree, TextArea, Label, TabbedContent
 
 from config import config
 from utils.logger import get_logger
+from ui.handlers.tool_handlers import ToolCard, ErrorMsg
 
 logger = get_logger()
 WORKSPACE_DIR = config.workspace.base_dir
@@ -22,33 +25,74 @@ LANG_MAP = {
 RUN_CMD_MAP = {".py": "python", ".js": "node"}
 
 
+async def _wait_exit(proc) -> None:
+    """
+    Child process'in bitmesini bekle. Linux'ta (5.3+) pidfd event loop'a
+    reader olarak eklenir: çıkışta tek bir epoll uyanması, polling yok.
+    """
+    try:
+        fd = os.pidfd_open(proc.pid)
+    except (AttributeError, OSError):
+        # pidfd yok ya da process çoktan toplandı
+        await proc.wait()
+        return
+    
+    loop = asyncio.get_running_loop()
+    exited = loop.create_future()
+    loop.add_reader(fd, lambda: exited.done() or exited.set_result(None))
+    try:
+        await exited
+    finally:
+        loop.remove_reader(fd)
+        os.close(fd)
+    
+    # Process bitti; wait() yalnızca returncode için, beklemeden döner
+    await proc.wait()
+
+
 class FileHandler:
     """Dosya işlemlerini yöneten sınıf"""
     
     def __init__(self, app):
         self.app = app
         self.current_file_path = None
+        self._basename = None
+        self._ext = None
+        # Yazılmayı bekleyen kayıtlar (path -> text); eşzamanlı kayıtlar birleştirilir
+        self._pending_saves: dict = {}
+        self._saving = False
+        self._editor = None
     
-    def open_file(self, file_path: str) -> bool:
+    @property
+    def editor(self) -> TextArea:
+        """Kod editörü (ilk erişimde bulunur, sonra cache'den)"""
+        if self._editor is None:
+            self._editor = self.app.query_one("#code-editor", TextArea)
+        return self._editor
+    
+    @staticmethod
+    def _read_text(file_path: str) -> str:
+        with open(file_path, "r", encoding="utf-8") as f:
+            return f.read()
+    
+    async def open_file(self, file_path: str) -> bool:
         """Dosyayı editörde aç"""
         if not os.path.isfile(file_path):
             return False
         
         self.current_file_path = file_path
+        self._basename = os.path.basename(file_path)
+        self._ext = sys.intern(os.path.splitext(file_path)[1].lower())
         
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            # Okuma UI event loop'unu bloklamasın
+            content = await asyncio.to_thread(self._read_text, file_path)
             
-            ext = os.path.splitext(file_path)[1].lower()
+            editor = self.editor
+            editor.load_text(content)
+            editor.language = LANG_MAP.get(self._ext, "python")
             
-            editor = self.app.query_one("#code-editor", TextArea)
-            editor.text = content
-            editor.language = LANG_MAP.get(ext, "python")
-            
-            self.app.query_one("#editor-header", Label).update(
-                f"📄 {os.path.basename(file_path)}"
-            )
+            self.app.query_one("#editor-header", Label).update(f"📄 {self._basename}")
             # Right panel'deki TabbedContent'i seç
             self.app.query_one("#right-tabs", TabbedContent).active = "tab-editor"
             
@@ -59,59 +103,86 @@ class FileHandler:
             self.app.notify(f"Hata: {e}", severity="error")
             return False
     
-    def save_file(self) -> bool:
+    @staticmethod
+    def _write_text(file_path: str, text: str) -> None:
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(text)
+    
+    async def save_file(self) -> bool:
         """Mevcut dosyayı kaydet"""
         if not self.current_file_path:
             return False
         
+        editor = self.editor
+        self._pending_saves[self.current_file_path] = editor.text
+        
+        # Devam eden bir yazım varsa en güncel içeriği o yazacak
+        if self._saving:
+            return True
+        
+        self._saving = True
         try:
-            editor = self.app.query_one("#code-editor", TextArea)
-            with open(self.current_file_path, "w", encoding="utf-8") as f:
-                f.write(editor.text)
-            
-            self.app.notify(f"Kaydedildi: {os.path.basename(self.current_file_path)}")
+            while self._pending_saves:
+                file_path, text = self._pending_saves.popitem()
+                await asyncio.to_thread(self._write_text, file_path, text)
+                self.app.notify(f"Kaydedildi: {os.path.basename(file_path)}")
             return True
             
         except Exception as e:
             logger.error(f"File save error: {e}")
             self.app.notify(f"Hata: {e}", severity="error")
             return False
+        finally:
+            self._saving = False
     
-    def run_file(self, dashboard) -> bool:
+    @staticmethod
+    def _read_captured(*files) -> tuple:
+        result = []
+        for f in files:
+            f.seek(0)
+            result.append(f.read())
+        return tuple(result)
+    
+    async def run_file(self, dashboard) -> bool:
         """Mevcut dosyayı çalıştır"""
         if not self.current_file_path:
             return False
         
-        filename = os.path.basename(self.current_file_path)
-        ext = os.path.splitext(filename)[1].lower()
-        
-        if ext not in RUN_CMD_MAP:
+        filename = self._basename
+        run_cmd = RUN_CMD_MAP.get(self._ext)
+        if run_cmd is None:
             return False
         
         try:
-            result = subprocess.run(
-                f"{RUN_CMD_MAP[ext]} {filename}",
-                shell=True, cwd=WORKSPACE_DIR,
-                capture_output=True, text=True, timeout=10
-            )
+            # Çıktı pipe yerine doğrudan geçici dosyalara yazılır, bitince tek seferde okunur
+            with tempfile.TemporaryFile() as out_f, tempfile.TemporaryFile() as err_f:
+                # Shell yok: argv listesi, event loop bloklanmaz
+                proc = await asyncio.create_subprocess_exec(
+                    run_cmd, filename,
+                    cwd=WORKSPACE_DIR,
+                    stdout=out_f,
+                    stderr=err_f
+                )
+                try:
+                    await asyncio.wait_for(_wait_exit(proc), timeout=10)
+                except asyncio.TimeoutError:
+                    proc.kill()
+                    await proc.wait()
+                    await dashboard.mount(ErrorMsg(
+                        f"[red]Timeout: {filename} 10 saniyede tamamlanmadı[/red]"
+                    ))
+                    return False
+                
+                stdout, stderr = await asyncio.to_thread(self._read_captured, out_f, err_f)
             
-            output = result.stdout or "[Çıktı yok]"
-            if result.stderr:
-                output += f"\n[red]{result.stderr}[/red]"
+            output = stdout.decode("utf-8", errors="replace") or "[Çıktı yok]"
+            if stderr:
+                output += f"\n[red]{stderr.decode('utf-8', errors='replace')}[/red]"
             
-            dashboard.mount(Static(
-                f"[cyan]▶ {filename}:[/cyan]\n{output}",
-                classes="tool-card"
-            ))
+            await dashboard.mount(ToolCard(f"[cyan]▶ {filename}:[/cyan]\n{output}"))
             return True
             
-        except subprocess.TimeoutExpired:
-            dashboard.mount(Static(
-                f"[red]Timeout: {filename} 10 saniyede tamamlanmadı[/red]",
-                classes="error-msg"
-            ))
-            return False
         except Exception as e:
             logger.error(f"File run error: {e}")
-            dashboard.mount(Static(f"[red]Hata: {e}[/red]", classes="error-msg"))
+            await dashboard.mount(ErrorMsg(f"[red]Hata: {e}[/red]"))
             return False
@@ -1,6 +1,7 @@
 """
 Tool Output Handlers - Dashboard'da tool çıktılarını gösterir
 """
+import re
 import json
 from rich.text import Text
 from textual.widgets import Static, DirectoryTree, TabbedContent
@@ -9,6 +10,13 @@ from utils.logger import get_logger
 
 logger = get_logger()
 
+# orjson varsa C tabanlı parser kullan
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Tool status mapping
 TOOL_STATUS_MAP = {
     "call_coder": ("🔧 Coder", "green"),
@@ -40,12 +48,68 @@ TOOL_STATUS_MAP = {
     "run_unittest": ("🧪 Unittest", "cyan"),
 }
 
+# "⚠️ PERMISSION_REQUIRED:cmd:full_cmd" -> (cmd, full_cmd)
+PERMISSION_RE = re.compile(r"PERMISSION_REQUIRED:([^:]*):(.*)", re.DOTALL)
+
+# search_codebase çıktısında her dosya satırının başındaki işaret
+_FILE_MARKER = "📄"
+
+# Handler'ların sabit önekleri (her olayda kopyalanır)
+_PREFIX_CODER = Text.assemble(("✓ Coder: ", "green"))
+_PREFIX_RESEARCHER = Text.assemble(("✓ Researcher: ", "cyan"))
+_PREFIX_TODO_DONE = Text.assemble(("✅ ", "green"))
+_PREFIX_TODO = Text.assemble(("📋 ", "yellow"))
+_PREFIX_TERMINAL = Text.assemble(("Terminal: ", "cyan"))
+_PREFIX_BULLET = Text.assemble(("• ", "blue"))
+_PREFIX_SEARCH = Text.assemble(("Search: ", "blue"))
+_PREFIX_MEMORY_SEARCH = Text.assemble(("🧠 Hafıza Tarandı: ", "bold magenta"))
+_PREFIX_MEMORY_REFRESH = Text.assemble(("🧠 Hafıza Güncellendi: ", "bold magenta"))
+_PREFIX_GIT_STATUS = Text.assemble(("📊 Git Status:\n", "bold blue"))
+_PREFIX_GIT_LOG = Text.assemble(("📜 Git Log:\n", "bold blue"))
+_PREFIX_GIT_DIFF = Text.assemble(("📝 Git Diff:\n", "bold blue"))
+_PREFIX_CREATE_TEST = Text.assemble(("📝 ", "cyan"))
+_PREFIX_LIST_TESTS = Text.assemble(("📋 Tests:\n", "bold cyan"))
+
+# short_output kullanmayan handler'lar - kısaltma hesaplanmaz
+_IGNORES_SHORT_OUTPUT = frozenset({
+    "create_plan", "write_file", "delete_file", "create_directory", "update_todo_list",
+})
+
+
+class ToolCard(Static):
+    """Dashboard'daki tool çıktı kartı"""
+    DEFAULT_CLASSES = "tool-card"
+
+
+class ErrorMsg(Static):
+    """Dashboard'daki hata kartı"""
+    DEFAULT_CLASSES = "error-msg"
+
 
 class ToolOutputHandler:
     """Tool çıktılarını işleyen sınıf"""
     
     def __init__(self, app):
         self.app = app
+        self._workspace_tree = None
+        self._reload_timer = None
+    
+    @property
+    def workspace_tree(self) -> DirectoryTree:
+        """Workspace ağacı (ilk erişimde bulunur, sonra cache'den)"""
+        if self._workspace_tree is None:
+            self._workspace_tree = self.app.query_one("#workspace-tree", DirectoryTree)
+        return self._workspace_tree
+    
+    def _schedule_tree_reload(self) -> None:
+        """Ağacı 100ms sonra yenile - art arda gelen dosya tool'ları tek reload'a düşer"""
+        if self._reload_timer is not None:
+            self._reload_timer.stop()
+        self._reload_timer = self.app.set_timer(0.1, self._reload_tree)
+    
+    def _reload_tree(self) -> None:
+        self._reload_timer = None
+        self.workspace_tree.reload()
     
     def get_status(self, tool_name: str) -> tuple:
         """Tool için status ve renk döndür"""
@@ -53,29 +117,27 @@ class ToolOutputHandler:
     
     async def handle(self, tool_name: str, output: str, dashboard):
         """Tool çıktısını dashboard'a ekle"""
-        short_output = output[:500] + "..." if len(output) > 500 else output
-        
-        handler_method = getattr(self, f"_handle_{tool_name}", None)
-        if handler_method:
-            await handler_method(output, short_output, dashboard)
+        handler = self._HANDLERS.get(tool_name)
+        if handler:
+            if tool_name in _IGNORES_SHORT_OUTPUT or len(output) <= 500:
+                short_output = output
+            else:
+                short_output = f"{output[:500]}..."
+            await handler(self, output, short_output, dashboard)
         else:
             await self._handle_default(tool_name, dashboard)
         
         dashboard.scroll_end()
     
     async def _handle_call_coder(self, output: str, short_output: str, dashboard):
-        self.app.query_one("#workspace-tree", DirectoryTree).reload()
+        self._schedule_tree_reload()
         
         # Permission mesajı kontrolü (coder içinden gelebilir)
-        if "PERMISSION_REQUIRED:" in output:
-            perm_idx = output.find("PERMISSION_REQUIRED:")
-            perm_part = output[perm_idx:]
-            parts = perm_part.split(":")
-            if len(parts) >= 3:
-                base_cmd = parts[1]
-                full_cmd = ":".join(parts[2:])
-                await self.app._show_permission_dialog(base_cmd, full_cmd)
-                return
+        perm_match = PERMISSION_RE.search(output)
+        if perm_match:
+            base_cmd, full_cmd = perm_match.groups()
+            await self.app._show_permission_dialog(base_cmd, full_cmd)
+            return
         
         # Rate limit / key rotation bildirimi
         if "API key rotated" in output or "Switched to fallback" in output:
@@ -84,10 +146,9 @@ class ToolOutputHandler:
             if hasattr(self.app, '_show_api_key_status'):
                 self.app._show_api_key_status()
         
-        text = Text()
-        text.append("✓ Coder: ", style="green")
+        text = _PREFIX_CODER.copy()
         text.append(short_output)
-        await dashboard.mount(Static(text, classes="tool-card"))
+        await dashboard.mount(ToolCard(text))
     
     async def _handle_call_researcher(self, output: str, short_output: str, dashboard):
         # Rate limit / key rotation bildirimi
@@ -96,109 +157,99 @@ class ToolOutputHandler:
             if hasattr(self.app, '_show_api_key_status'):
                 self.app._show_api_key_status()
         
-        text = Text()
-        text.append("✓ Researcher: ", style="cyan")
+        text = _PREFIX_RESEARCHER.copy()
         text.append(short_output)
-        await dashboard.mount(Static(text, classes="tool-card"))
+        await dashboard.mount(ToolCard(text))
     
     async def _handle_create_plan(self, output: str, short_output: str, dashboard):
-        await dashboard.mount(Static(Text("✓ Plan oluşturuldu", style="yellow"), classes="tool-card"))
+        await dashboard.mount(ToolCard(Text("✓ Plan oluşturuldu", style="yellow")))
     
     async def _handle_write_file(self, output: str, short_output: str, dashboard):
-        self.app.query_one("#workspace-tree", DirectoryTree).reload()
-        await dashboard.mount(Static(Text("✓ write_file", style="green"), classes="tool-card"))
+        self._schedule_tree_reload()
+        await dashboard.mount(ToolCard(Text("✓ write_file", style="green")))
     
     async def _handle_delete_file(self, output: str, short_output: str, dashboard):
-        self.app.query_one("#workspace-tree", DirectoryTree).reload()
-        await dashboard.mount(Static(Text("✓ delete_file", style="green"), classes="tool-card"))
+        self._schedule_tree_reload()
+        await dashboard.mount(ToolCard(Text("✓ delete_file", style="green")))
     
     async def _handle_create_directory(self, output: str, short_output: str, dashboard):
-        self.app.query_one("#workspace-tree", DirectoryTree).reload()
-        await dashboard.mount(Static(Text("✓ create_directory", style="green"), classes="tool-card"))
+        self._schedule_tree_reload()
+        await dashboard.mount(ToolCard(Text("✓ create_directory", style="green")))
     
     async def _handle_update_todo_list(self, output: str, short_output: str, dashboard):
         text = Text()
         text.append("📋 Todo güncellendi", style="yellow")
-        await dashboard.mount(Static(text, classes="tool-card"))
+        await dashboard.mount(ToolCard(text))
     
     async def _handle_mark_todo_done(self, output: str, short_output: str, dashboard):
-        text = Text()
-        text.append("✅ ", style="green")
+        text = _PREFIX_TODO_DONE.copy()
         text.append(short_output)
-        await dashboard.mount(Static(text, classes="tool-card"))
+        await dashboard.mount(ToolCard(text))
     
     async def _handle_get_next_todo_step(self, output: str, short_output: str, dashboard):
-        text = Text()
-        text.append("📋 ", style="yellow")
+        text = _PREFIX_TODO.copy()
         text.append(short_output)
-        await dashboard.mount(Static(text, classes="tool-card"))
+        await dashboard.mount(ToolCard(text))
     
     async def _handle_get_current_todo(self, output: str, short_output: str, dashboard):
-        text = Text()
-        text.append("📋 ", style="yellow")
+        text = _PREFIX_TODO.copy()
         text.append(short_output)
-        await dashboard.mount(Static(text, classes="tool-card"))
+        await dashboard.mount(ToolCard(text))
     
     async def _handle_run_terminal_command(self, output: str, short_output: str, dashboard):
         # Permission mesajı kontrolü (sub-agent'tan gelebilir)
-        if "PERMISSION_REQUIRED:" in output:
-            perm_idx = output.find("PERMISSION_REQUIRED:")
-            perm_part = output[perm_idx:]
-            parts = perm_part.split(":")
-            if len(parts) >= 3:
-                base_cmd = parts[1]
-                full_cmd = ":".join(parts[2:])
-                await self.app._show_permission_dialog(base_cmd, full_cmd)
-                return
+        perm_match = PERMISSION_RE.search(output)
+        if perm_match:
+            base_cmd, full_cmd = perm_match.groups()
+            await self.app._show_permission_dialog(base_cmd, full_cmd)
+            return
         
-        text = Text()
-        text.append("Terminal: ", style="cyan")
+        text = _PREFIX_TERMINAL.copy()
         text.append(short_output)
-        await dashboard.mount(Static(text, classes="tool-card"))
+        await dashboard.mount(ToolCard(text))
     
     async def _handle_web_search(self, output: str, short_output: str, dashboard):
         try:
-            results = json.loads(output)
+            results = _json_loads(output)
+            widgets = []
             for r in results[:3]:
-                title = r.get('title', '')[:50]
-                text = Text()
-                text.append("• ", style="blue")
-                text.append(title)
-                await dashboard.mount(Static(text, classes="tool-card"))
+                text = _PREFIX_BULLET.copy()
+                text.append(r.get('title', '')[:50])
+                widgets.append(ToolCard(text))
         except:
-            text = Text()
-            text.append("Search: ", style="blue")
+            text = _PREFIX_SEARCH.copy()
             text.append(short_output)
-            await dashboard.mount(Static(text, classes="tool-card"))
+            widgets = [ToolCard(text)]
+        
+        await dashboard.mount_all(widgets)
     
     async def _handle_search_codebase(self, output: str, short_output: str, dashboard):
-        text = Text()
-        text.append("🧠 Hafıza Tarandı: ", style="bold magenta")
-        file_count = output.count("📄")
+        text = _PREFIX_MEMORY_SEARCH.copy()
+        file_count = output.count(_FILE_MARKER)
         if file_count > 0:
             text.append(f"{file_count} ilgili dosya bulundu")
         else:
             text.append(short_output[:100])
-        await dashboard.mount(Static(text, classes="tool-card"))
+        await dashboard.mount(ToolCard(text))
     
     async def _handle_refresh_memory(self, output: str, short_output: str, dashboard):
-        text = Text()
-        text.append("🧠 Hafıza Güncellendi: ", style="bold magenta")
+        text = _PREFIX_MEMORY_REFRESH.copy()
         text.append(short_output)
-        await dashboard.mount(Static(text, classes="tool-card"))
+        await dashboard.mount(ToolCard(text))
     
     async def _handle_lint_and_fix(self, output: str, short_output: str, dashboard):
         text = Text()
-        if "successfully" in output.lower():
+        lowered = output.lower()
+        if "successfully" in lowered:
             text.append("✨ Code Polished: ", style="bold green")
             text.append("Kod formatlandı ve temizlendi")
-        elif "error" in output.lower():
+        elif "error" in lowered:
             text.append("✨ Lint Error: ", style="bold red")
             text.append(short_output)
         else:
             text.append("✨ Code Polish: ", style="bold magenta")
             text.append(short_output)
-        await dashboard.mount(Static(text, classes="tool-card"))
+        await dashboard.mount(ToolCard(text))
     
     async def _handle_check_syntax(self, output: str, short_output: str, dashboard):
         text = Text()
@@ -207,14 +258,13 @@ class ToolOutputHandler:
         else:
             text.append("⚠ Syntax Error: ", style="bold red")
             text.append(short_output)
-        await dashboard.mount(Static(text, classes="tool-card"))
+        await dashboard.mount(ToolCard(text))
     
     # Git handlers
     async def _handle_git_status(self, output: str, short_output: str, dashboard):
-        text = Text()
-        text.append("📊 Git Status:\n", style="bold blue")
+        text = _PREFIX_GIT_STATUS.copy()
         text.append(short_output)
-        await dashboard.mount(Static(text, classes="tool-card"))
+        await dashboard.mount(ToolCard(text))
     
     async def _handle_git_commit(self, output: str, short_output: str, dashboard):
         text = Text()
@@ -224,31 +274,30 @@ class ToolOutputHandler:
         else:
             text.append("Git Commit: ", style="blue")
             text.append(short_output)
-        await dashboard.mount(Static(text, classes="tool-card"))
+        await dashboard.mount(ToolCard(text))
     
     async def _handle_git_log(self, output: str, short_output: str, dashboard):
-        text = Text()
-        text.append("📜 Git Log:\n", style="bold blue")
+        text = _PREFIX_GIT_LOG.copy()
         text.append(short_output)
-        await dashboard.mount(Static(text, classes="tool-card"))
+        await dashboard.mount(ToolCard(text))
     
     async def _handle_git_diff(self, output: str, short_output: str, dashboard):
-        text = Text()
-        text.append("📝 Git Diff:\n", style="bold blue")
+        text = _PREFIX_GIT_DIFF.copy()
         text.append(short_output)
-        await dashboard.mount(Static(text, classes="tool-card"))
+        await dashboard.mount(ToolCard(text))
     
     # Test handlers
     async def _handle_run_tests(self, output: str, short_output: str, dashboard):
         text = Text()
-        if "✅" in output or "passed" in output.lower():
+        lowered = output.lower()
+        if "✅" in output or "passed" in lowered:
             text.append("🧪 Tests Passed:\n", style="bold green")
-        elif "❌" in output or "failed" in output.lower():
+        elif "❌" in output or "failed" in lowered:
             text.append("🧪 Tests Failed:\n", style="bold red")
         else:
             text.append("🧪 Test Results:\n", style="bold cyan")
         text.append(short_output)
-        await dashboard.mount(Static(text, classes="tool-card"))
+        await dashboard.mount(ToolCard(text))
     
     async def _handle_run_single_test(self, output: str, short_output: str, dashboard):
         text = Text()
@@ -257,20 +306,26 @@ class ToolOutputHandler:
         else:
             text.append("❌ Test Failed\n", style="bold red")
         text.append(short_output[:300])
-        await dashboard.mount(Static(text, classes="tool-card"))
+        await dashboard.mount(ToolCard(text))
     
     async def _handle_create_test_file(self, output: str, short_output: str, dashboard):
-        self.app.query_one("#workspace-tree", DirectoryTree).reload()
-        text = Text()
-        text.append("📝 ", style="cyan")
+        self._schedule_tree_reload()
+        text = _PREFIX_CREATE_TEST.copy()
         text.append(short_output)
-        await dashboard.mount(Static(text, classes="tool-card"))
+        await dashboard.mount(ToolCard(text))
     
     async def _handle_list_tests(self, output: str, short_output: str, dashboard):
-        text = Text()
-        text.append("📋 Tests:\n", style="bold cyan")
+        text = _PREFIX_LIST_TESTS.copy()
         text.append(short_output)
-        await dashboard.mount(Static(text, classes="tool-card"))
+        await dashboard.mount(ToolCard(text))
     
     async def _handle_default(self, tool_name: str, dashboard):
-        await dashboard.mount(Static(Text(tool_name, style="dim"), classes="tool-card"))
+        await dashboard.mount(ToolCard(Text(tool_name, style="dim")))
+
+
+# tool_name -> _handle_* metodu (sınıf tanımında bir kez oluşturulur)
+ToolOutputHandler._HANDLERS = {
+    name[len("_handle_"):]: fn
+    for name, fn in vars(ToolOutputHandler).items()
+    if name.startswith("_handle_") and name != "_handle_default"
+}
@@ -0,0 +1,119 @@
+"""
+Settings Store - .atom_settings.json ve .atom_fallback.json okuma/yazma
+Dosya değişmedikçe parse edilmiş içerik cache'ten döner; yazma atomiktir.
+"""
+import json
+import os
+from functools import lru_cache
+
+from core.providers import PROVIDERS, get_provider_names, model_manager
+
+# orjson varsa C tabanlı parser/serializer kullan
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(data: dict) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(data: dict) -> bytes:
+        return json.dumps(data, indent=2).encode("utf-8")
+
+# Settings files in project root (not workspace)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SETTINGS_FILE = os.path.join(PROJECT_ROOT, ".atom_settings.json")
+FALLBACK_FILE = os.path.join(PROJECT_ROOT, ".atom_fallback.json")
+
+# path -> (mtime_ns, data) - dosya değişmedikçe tekrar okunup parse edilmez
+_CACHE = {}
+
+
+def _load_json(path: str) -> dict:
+    """JSON dosyasını oku; dönen dict cache'le paylaşılır, salt okunur kullanın"""
+    try:
+        mtime = os.stat(path).st_mtime_ns
+        cached = _CACHE.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        with open(path, "rb") as f:
+            data = _json_loads(f.read())
+        _CACHE[path] = (mtime, data)
+        return data
+    except Exception:
+        pass
+    return {}
+
+
+def _save_json(path: str, data: dict):
+    """JSON dosyasını atomik yaz; içerik aynıysa dosyaya dokunma"""
+    try:
+        blob = _json_dumps(data)
+        try:
+            with open(path, "rb") as f:
+                unchanged = f.read() == blob
+        except FileNotFoundError:
+            unchanged = False
+
+        if not unchanged:
+            # Yarım yazılmış dosya kalmasın: önce geçici dosyaya yaz, sonra değiştir
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(blob)
+            os.replace(tmp_path, path)
+        _CACHE[path] = (os.stat(path).st_mtime_ns, data)
+    except Exception:
+        _CACHE.pop(path, None)
+        raise
+
+
+def load_settings() -> dict:
+    """Load settings from .atom_settings.json"""
+    return _load_json(SETTINGS_FILE)
+
+
+def save_settings(settings: dict):
+    """Save settings to .atom_settings.json"""
+    try:
+        _save_json(SETTINGS_FILE, settings)
+    except Exception as e:
+        print(f"Settings save error: {e}")
+
+
+def load_fallbacks() -> dict:
+    """Load fallbacks from .atom_fallback.json"""
+    return _load_json(FALLBACK_FILE)
+
+
+def save_fallbacks_to_file(data: dict):
+    """Save fallbacks to .atom_fallback.json"""
+    try:
+        _save_json(FALLBACK_FILE, data)
+    except Exception as e:
+        print(f"Fallback save error: {e}")
+
+
+# Süreç boyunca tek kez oluşturulur; PROVIDERS çalışırken değişmez. Çalışma
+# zamanında provider eklenirse seçeneklerin görünmesi için
+# provider_options.cache_clear() çağrılmalı.
+@lru_cache(maxsize=1)
+def provider_options() -> tuple:
+    """Select için (görünen ad, provider) seçenekleri; PROVIDERS çalışırken değişmez"""
+    return tuple((PROVIDERS[p].name, p) for p in get_provider_names())
+
+
+def apply_saved_settings():
+    """Apply saved settings to model_manager on startup"""
+    settings = load_settings()
+    models = settings.get("models", {})
+
+    for role in model_manager.ROLES:
+        if role in models:
+            cfg = models[role]
+            model_manager.set_model(
+                role,
+                cfg.get("provider", "ollama"),
+                cfg.get("model", "llama3.2"),
+                cfg.get("temperature", 0.0)
+            )
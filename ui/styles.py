@@ -1,11 +1,26 @@
 """
 AtomAgent UI Styles - Theme Support
 """
+import sys
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+
+# Her temanın tanımlaması gereken renkler (get_theme_variables bunları okur)
+REQUIRED_COLORS = frozenset({
+    "bg", "fg", "panel_bg", "border", "accent", "success",
+    "error", "warning", "info", "dim", "highlight",
+})
+
 
 class Theme:
     def __init__(self, name, colors):
+        missing = REQUIRED_COLORS - colors.keys()
+        if missing:
+            raise ValueError(f"Theme '{name}' is missing colors: {', '.join(sorted(missing))}")
         self.name = name
-        self.colors = colors
+        # Salt okunur: türetilen değişkenler tema başına cache'leniyor
+        self.colors = MappingProxyType({k: sys.intern(v) for k, v in colors.items()})
 
 # Gruvbox Dark (Default)
 GRUVBOX = Theme("gruvbox", {
@@ -93,27 +108,40 @@ MONOKAI = Theme("monokai", {
     "error": "#ff6188",
     "warning": "#fc9867",
     "info": "#78dce8",
+    "dim": "#727072",
     "highlight": "#5b595c"
 })
 
-THEMES = {
+THEMES = MappingProxyType({
     "gruvbox": GRUVBOX,
     "dracula": DRACULA,
     "nord": NORD,
     "catppuccin": CATPPUCCIN,
     "cyberpunk": CYBERPUNK,
     "monokai": MONOKAI
-}
+})
 
-# Legacy STYLES variable (kept for compatibility, not used)
-STYLES = ""
+# (değişken adı, palet rengi) - her biri için -1/-2/-3 varyantı üretilir
+_DARKEN_VARIANTS = (
+    ("error", "error"), ("success", "success"), ("warning", "warning"),
+    ("accent", "accent"), ("primary", "accent"), ("secondary", "info"),
+    ("foreground", "dim"), ("background", "bg"),
+)
+_LIGHTEN_VARIANTS = (
+    ("primary", "accent"), ("secondary", "info"), ("accent", "accent"),
+    ("success", "success"), ("error", "error"), ("warning", "warning"),
+    ("background", "bg"), ("foreground", "fg"),
+    ("surface", "panel_bg"), ("panel", "panel_bg"),
+)
 
 
 def get_theme_variables(theme_name="gruvbox"):
     """Tema değişkenlerini dict olarak döndür"""
-    theme = THEMES.get(theme_name, GRUVBOX)
-    c = theme.colors
-    
+    return dict(_RESOLVED.get(theme_name, _RESOLVED["gruvbox"]))
+
+
+def _variables_for_colors(c):
+    """Renk paletinden Textual değişkenlerini üret"""
     # Temel değişkenler
     vars = {k: str(v) for k, v in c.items()}
     
@@ -174,15 +202,11 @@ def get_theme_variables(theme_name="gruvbox"):
         # Text Context Colors
         "text": c["fg"],
         "text-primary": c["fg"],
-        "text-pr": c["fg"],
         "text-secondary": c["dim"],
         "text-success": c["success"],
         "text-warning": c["warning"],
-        "text-warn": c["warning"],
         "text-error": c["error"],
         "text-accent": c["accent"],
-        "text-disabled": c["dim"],
-        "text-d": c["dim"],
         
         # Muted Backgrounds
         "primary-muted": c["panel_bg"],
@@ -220,64 +244,7 @@ def get_theme_variables(theme_name="gruvbox"):
         "surface-darken-1": c["bg"],
         "panel-darken-1": c["bg"],
         "panel-darken-2": c["bg"],
-        "error-darken-1": c["error"],
-        "error-darken-2": c["error"],
-        "error-darken-3": c["error"],
-        "success-darken-1": c["success"],
-        "success-darken-2": c["success"],
-        "success-darken-3": c["success"],
-        "warning-darken-1": c["warning"],
-        "warning-darken-2": c["warning"],
-        "warning-darken-3": c["warning"],
-        "accent-darken-1": c["accent"],
-        "accent-darken-2": c["accent"],
-        "accent-darken-3": c["accent"],
-        "primary-darken-1": c["accent"],
-        "primary-darken-2": c["accent"],
-        "primary-darken-3": c["accent"],
-        "secondary-darken-1": c["info"],
-        "secondary-darken-2": c["info"],
-        "secondary-darken-3": c["info"],
-        "foreground-darken-1": c["dim"],
-        "foreground-darken-2": c["dim"],
-        "foreground-darken-3": c["dim"],
-        "background-darken-1": c["bg"],
-        "background-darken-2": c["bg"],
-        "background-darken-3": c["bg"],
         
-        "background-darken-3": c["bg"],
-        
-        # Lighten variants
-        "primary-lighten-1": c["accent"],
-        "primary-lighten-2": c["accent"],
-        "primary-lighten-3": c["accent"],
-        "secondary-lighten-1": c["info"],
-        "secondary-lighten-2": c["info"],
-        "secondary-lighten-3": c["info"],
-        "accent-lighten-1": c["accent"],
-        "accent-lighten-2": c["accent"],
-        "accent-lighten-3": c["accent"],
-        "success-lighten-1": c["success"],
-        "success-lighten-2": c["success"],
-        "success-lighten-3": c["success"],
-        "error-lighten-1": c["error"],
-        "error-lighten-2": c["error"],
-        "error-lighten-3": c["error"],
-        "warning-lighten-1": c["warning"],
-        "warning-lighten-2": c["warning"],
-        "warning-lighten-3": c["warning"],
-        "background-lighten-1": c["bg"],
-        "background-lighten-2": c["bg"],
-        "background-lighten-3": c["bg"],
-        "foreground-lighten-1": c["fg"],
-        "foreground-lighten-2": c["fg"],
-        "foreground-lighten-3": c["fg"],
-        "surface-lighten-1": c["panel_bg"],
-        "surface-lighten-2": c["panel_bg"],
-        "surface-lighten-3": c["panel_bg"],
-        "panel-lighten-1": c["panel_bg"],
-        "panel-lighten-2": c["panel_bg"],
-        "panel-lighten-3": c["panel_bg"],
         "panel-bg": c["panel_bg"],
         
         # Markdown variables
@@ -301,805 +268,31 @@ def get_theme_variables(theme_name="gruvbox"):
         "markdown-h6-text-style": "italic",
     })
     
-    return vars
-
-
-
-# CSS Kuralları (Değişken tanımları olmadan)
-BASE_CSS = """
-    Screen {
-        background: $bg;
-        color: $fg;
-    }
-
-    /* === MAIN LAYOUT === */
-    #main-container {
-        layout: horizontal;
-        height: 100%;
-    }
-
-    /* === LEFT SIDEBAR === */
-    #left-sidebar {
-        width: 35;
-        height: 100%;
-        background: $bg;
-        border-right: solid $border;
-    }
-    
-    #sidebar-header-label, #right-header-label {
-        height: 3;
-        background: $panel-bg;
-        color: $accent;
-        text-align: center;
-        text-style: bold;
-        padding: 1;
-        border-bottom: solid $border;
-    }
-
-    .section-label {
-        height: 2;
-        background: $highlight;
-        padding: 0 1;
-        text-style: bold;
-        margin-top: 1;
-        color: $accent;
-    }
-
-    .info-box {
-        padding: 1;
-        background: $panel-bg;
-        border: solid $dim;
-        color: $fg;
-        margin: 0 1;
-    }
-    
-    #left-tabs {
-        height: 1fr;
-    }
-    
-    #session-sidebar {
-        width: 100%;
-        height: 100%;
-        background: $bg;
-        padding: 0;
-        margin: 0;
-        border: none;
-    }
-
-    /* === LEFT PANEL - CHAT === */
-    #left-panel {
-        width: 1fr;
-        height: 100%;
-        background: $bg;
-        border-right: solid $border;
-    }
-
-    #chat-header {
-        height: 3;
-        background: $panel-bg;
-        color: $accent;
-        text-align: center;
-        text-style: bold;
-        padding: 1;
-        border-bottom: solid $border;
-    }
-
-    #chat-scroll {
-        height: 1fr;
-        padding: 1 2;
-        background: $bg;
-    }
-
-    /* Chat Messages */
-    .user-msg {
-        background: $highlight;
-        color: $info;
-        padding: 1;
-        margin: 1 0;
-        border-left: thick $info;
-    }
-
-    .ai-msg {
-        background: $panel-bg;
-        color: $fg;
-        padding: 1;
-        margin: 1 0;
-        border-left: thick $success;
-    }
-
-    .system-msg {
-        color: $dim;
-        text-style: italic;
-        padding: 0 1;
-        margin: 1 0;
-    }
-
-    /* Status Bar */
-    #status-bar {
-        height: 1;
-        background: $highlight;
-        color: $fg;
-        padding: 0 1;
-        text-align: left;
-    }
-    
-    #status-container {
-        height: auto;
-        background: $highlight;
-        padding: 0 1;
-    }
-
-    #input-container {
-        height: auto;
-        padding: 1;
-        background: $panel-bg;
-        border-top: solid $border;
-    }
-
-    #user-input {
-        background: $highlight;
-        color: $fg;
-        border: tall $highlight;
-        padding: 0 1;
-        height: 3;
-        width: 1fr;
-    }
-
-    #user-input:focus {
-        border: tall $accent;
-    }
-    
-    .stop-btn {
-        width: 5;
-        min-width: 5;
-        height: 3;
-        margin-left: 1;
-    }
-
-    /* === RIGHT PANEL === */
-    #right-panel {
-        width: 45;
-        height: 100%;
-        background: $panel-bg;
-    }
-
-    /* === TABS === */
-    Tabs {
-        background: $bg;
-        color: $dim;
-        height: 3;
-        dock: top;
-        padding: 0 1;
-    }
-
-    Tab {
-        background: $bg;
-        color: $dim;
-        padding: 0 2;
-        height: 3;
-        border-top: none;
-        border-left: none;
-        border-right: none;
-        border-bottom: thick transparent;
-        content-align: center middle;
-    }
-
-    Tab:hover {
-        background: $panel-bg;
-        color: $fg;
-        border-bottom: thick $highlight;
-    }
-
-    Tab.-active {
-        background: $bg;
-        color: $accent;
-        text-style: bold;
-        border-bottom: thick $accent;
-    }
-    
-    /* Remove underline from active tab content */
-    Tab.-active .underline--bar {
-        color: $accent;
-    }
-
-    /* === DASHBOARD === */
-    #dashboard-view {
-        height: 1fr;
-        padding: 1;
-        background: $panel-bg;
-    }
-
-    .tool-card {
-        background: $highlight;
-        border: solid $highlight;
-        padding: 1;
-        margin: 0 0 1 0;
-    }
-
-    /* === WORKSPACE === */
-    #workspace-container {
-        height: 100%;
-        background: $panel-bg;
-        overflow-y: auto;
-    }
-
-    .tree-label {
-        height: 2;
-        background: $highlight;
-        padding: 0 1;
-        text-style: bold;
-        margin-top: 1;
-    }
-
-    DirectoryTree {
-        background: $panel-bg;
-        color: $fg;
-        padding: 0 1;
-        height: auto;
-        max-height: 50%;
-    }
-    
-    SandboxTree {
-        background: $panel-bg;
-        color: $fg;
-        padding: 0 1;
-        height: auto;
-        max-height: 50%;
-    }
-
-    DirectoryTree > .directory-tree--folder {
-        color: $warning;
-    }
-
-    DirectoryTree > .directory-tree--file {
-        color: $fg;
-    }
-
-    /* === EDITOR === */
-    #editor-container {
-        height: 100%;
-        background: $bg;
-    }
-
-    #editor-toolbar {
-        height: 3;
-        background: $panel-bg;
-        border-bottom: solid $border;
-        align: left middle;
-        padding: 0 1;
-    }
-
-    #editor-header {
-        height: 1;
-        background: transparent;
-        color: $info;
-        text-style: bold;
-        border: none;
-        width: 1fr;
-        padding: 0;
-    }
-    
-    .small-btn {
-        min-width: 8;
-        height: 1;
-        margin-left: 1;
-        border: none;
-    }
-
-    #code-editor {
-        height: 1fr;
-        background: $bg;
-        color: $fg;
-    }
-    
-    /* === FOOTER === */
-    Footer {
-        background: $bg;
-        color: $dim;
-    }
-
-    Footer > .footer--key {
-        background: $highlight;
-        color: $accent;
-    }
-
-    /* === SESSION SIDEBAR WIDGETS === */
-    /* === SESSION SIDEBAR WIDGETS === */
-    SessionSidebar {
-        width: 100%;
-        height: 100%;
-        background: $bg;
-        border-right: solid $border;
-        padding: 0;
-        margin: 0;
-    }
-    
-    TabbedContent {
-        height: 100%;
-        background: $bg;
-    }
-    
-    ContentSwitcher {
-        height: 1fr;
-        background: $bg;
-    }
-    
-    TabPane {
-        height: 100%;
-        padding: 0;
-        background: $bg;
-    }
-
-    Tree {
-        background: $panel-bg;
-        color: $fg;
-        padding: 0 1;
-        height: auto;
-        max-height: 50%;
-    }
-    
-    #sidebar-header {
-        height: 3;
-        background: $panel-bg;
-        color: $accent;
-        text-align: center;
-        text-style: bold;
-        padding: 1;
-        border-bottom: solid $border;
-        margin: 0;
-    }
-    
-    #sidebar-actions {
-        height: auto;
-        padding: 1;
-        background: $panel-bg;
-        border-bottom: solid $border;
-    }
-    
-    #sidebar-actions Button {
-        width: 100%;
-        margin: 0;
-    }
-    
-    #btn-new-session {
-        background: $success;
-        color: $bg;
-    }
-    
-    #btn-new-session:hover {
-        background: $success;
-        opacity: 80%;
-    }
-    
-    #session-list-scroll {
-        height: 1fr;
-        padding: 1;
-        background: $bg;
-    }
-    
-    #session-list {
-        height: auto;
-    }
+    # -darken-N / -lighten-N varyantları temel renkle aynı
+    for name, color in _DARKEN_VARIANTS:
+        for n in (1, 2, 3):
+            vars[f"{name}-darken-{n}"] = c[color]
+    for name, color in _LIGHTEN_VARIANTS:
+        for n in (1, 2, 3):
+            vars[f"{name}-lighten-{n}"] = c[color]
     
-    #sidebar-footer {
-        height: auto;
-        padding: 1;
-        background: $panel-bg;
-        border-top: solid $border;
-        text-align: center;
-    }
-    
-    .no-sessions {
-        color: $dim;
-        text-align: center;
-        padding: 2;
-    }
+    return vars
 
-    SessionItem {
-        height: auto;
-        padding: 1;
-        margin: 0 0 1 0;
-        background: $highlight;
-        border-left: thick transparent;
-    }
-    
-    SessionItem:hover {
-        background: $highlight;
-        border-left: thick $accent;
-        opacity: 90%;
-    }
-    
-    SessionItem.active {
-        background: $highlight;
-        border-left: thick $success;
-    }
-    
-    SessionItem .session-title {
-        color: $fg;
-        height: auto;
-        width: 1fr;
-    }
-    
-    SessionItem .session-meta {
-        color: $dim;
-        height: auto;
-    }
-    
-    SessionItem .session-row {
-        height: auto;
-        width: 100%;
-        align: left middle;
-    }
-    
-    SessionItem .btn-delete {
-        width: 3;
-        min-width: 3;
-        max-width: 3;
-        height: 1;
-        background: $highlight;
-        color: $dim;
-        border: none;
-        padding: 0;
-        margin: 0;
-        text-align: center;
-    }
-    
-    SessionItem .btn-delete:hover {
-        color: $error;
-        background: $highlight;
-    }
-    
-    SessionItem .btn-delete:focus {
-        color: $error;
-    }
 
-    /* === SANDBOX PANEL === */
-    SandboxPanel {
-        height: 100%;
-        background: $bg;
-        padding: 1;
-    }
-    
-    #sandbox-header {
-        height: 3;
-        background: $panel-bg;
-        padding: 1;
-        border-bottom: solid $border;
-    }
-    
-    #sandbox-title {
-        color: $accent;
-        text-style: bold;
-    }
-    
-    #sandbox-status-indicator {
-        color: $dim;
-    }
-    
-    #sandbox-controls {
-        height: auto;
-        padding: 1;
-        background: $panel-bg;
-        border-bottom: solid $border;
-    }
-    
-    #sandbox-controls Button {
-        margin-right: 1;
-        min-width: 12;
-    }
-    
-    #btn-sandbox-start {
-        background: $success;
-        color: $bg;
-    }
-    
-    #btn-sandbox-stop {
-        background: $error;
-        color: $fg;
-    }
-    
-    #btn-sandbox-clear {
-        background: $info;
-        color: $fg;
-    }
-    
-    #terminal-container {
-        height: 1fr;
-        padding: 0;
-    }
-    
-    #sandbox-terminal {
-        height: 1fr;
-        background: #0d0d0d;
-        color: $fg;
-        padding: 1;
-        border: solid $border;
-    }
-    
-    #sandbox-footer {
-        height: auto;
-        padding: 1;
-        background: $panel-bg;
-        border-top: solid $border;
-        color: $dim;
-    }
+# Tema adı -> değişkenler (import sırasında bir kez hesaplanır)
+_RESOLVED = {name: _variables_for_colors(theme.colors) for name, theme in THEMES.items()}
 
-    SandboxTerminal {
-        height: 1fr;
-        background: $bg;
-        border: solid $border;
-        padding: 1;
-    }
 
-    /* === MODEL SELECTOR MODAL === */
-    ModelSelectorModal {
-        align: center middle;
-    }
-    
-    #model-modal {
-        width: 75;
-        height: 85%;
-        max-height: 50;
-        background: $panel-bg;
-        border: solid $accent;
-        padding: 0;
-    }
-    
-    #model-modal-header {
-        height: 3;
-        background: $bg;
-        border-bottom: solid $border;
-        padding: 0 1;
-    }
-    
-    #model-modal-title {
-        width: 1fr;
-        content-align: left middle;
-        text-style: bold;
-        color: $accent;
-    }
-    
-    #model-modal-header #btn-close {
-        width: 5;
-        min-width: 5;
-    }
-    
-    #model-modal-info {
-        height: 3;
-        padding: 1;
-        text-align: center;
-        border-bottom: solid $border;
-    }
-    
-    #model-list {
-        height: 1fr;
-        padding: 1;
-        scrollbar-gutter: stable;
-    }
-    
-    .model-card {
-        background: $bg;
-        border: solid $border;
-        margin-bottom: 1;
-        padding: 1;
-        height: auto;
-    }
-    
-    .model-card-secondary {
-        border: dashed $dim;
-    }
-    
-    .model-card-header {
-        height: 3;
-        margin-bottom: 1;
-    }
-    
-    .model-card-title {
-        width: 1fr;
-        text-style: bold;
-        color: $fg;
-        content-align: left middle;
-    }
-    
-    .model-card-status {
-        width: auto;
-        color: $dim;
-        content-align: right middle;
-    }
-    
-    .model-card-row {
-        height: 3;
-        margin-bottom: 1;
-    }
-    
-    .model-label {
-        width: 12;
-        content-align: left middle;
-        color: $dim;
-    }
-    
-    .model-select {
-        width: 1fr;
-    }
-    
-    .model-input {
-        width: 1fr;
-    }
-    
-    .model-card-actions {
-        height: 3;
-        margin-top: 1;
-    }
-    
-    .test-btn {
-        width: 12;
-    }
-    
-    .test-result {
-        width: 1fr;
-        content-align: left middle;
-        padding-left: 1;
-        color: $info;
-    }
-    
-    .section-divider {
-        height: 3;
-        text-align: center;
-        color: $dim;
-        content-align: center middle;
-        margin: 1 0;
-    }
-    
-    #model-modal-footer {
-        height: 4;
-        align: center middle;
-        border-top: solid $border;
-        padding: 1;
-        background: $bg;
-    }
-    
-    #model-modal-footer Button {
-        margin: 0 1;
-        min-width: 12;
-    }
-
-    /* === FALLBACK SELECTOR MODAL === */
-    FallbackSelectorModal {
-        align: center middle;
-    }
-    
-    #fallback-modal {
-        width: 80;
-        height: 85%;
-        max-height: 50;
-        background: $panel-bg;
-        border: solid $warning;
-        padding: 0;
-    }
-    
-    #fallback-modal-header {
-        height: 3;
-        background: $bg;
-        border-bottom: solid $border;
-        padding: 0 1;
-    }
-    
-    #fallback-modal-title {
-        width: 1fr;
-        content-align: left middle;
-        text-style: bold;
-        color: $warning;
-    }
-    
-    #fallback-modal-header #btn-close {
-        width: 5;
-        min-width: 5;
-    }
-    
-    #fallback-modal-info {
-        height: 3;
-        padding: 1;
-        text-align: center;
-        border-bottom: solid $border;
-    }
-    
-    #fallback-list {
-        height: 1fr;
-        padding: 1;
-        scrollbar-gutter: stable;
-    }
-    
-    .fallback-card {
-        background: $bg;
-        border: solid $border;
-        margin-bottom: 1;
-        padding: 1;
-        height: auto;
-    }
-    
-    .fallback-card-header {
-        height: 3;
-        margin-bottom: 1;
-        border-bottom: dashed $dim;
-        padding-bottom: 1;
-    }
-    
-    .fallback-card-title {
-        width: auto;
-        text-style: bold;
-        color: $fg;
-        margin-right: 2;
-        content-align: left middle;
-    }
-    
-    .fallback-primary-info {
-        width: 1fr;
-        content-align: right middle;
-    }
-    
-    .fallback-row {
-        height: 3;
-        margin-bottom: 1;
-    }
-    
-    .fallback-index {
-        width: 4;
-        content-align: center middle;
-        color: $accent;
-        text-style: bold;
-    }
-    
-    .fallback-select {
-        width: 22;
-        margin-right: 1;
-    }
-    
-    .fallback-input {
-        width: 1fr;
-    }
-    
-    #fallback-modal-footer {
-        height: 4;
-        align: center middle;
-        border-top: solid $border;
-        padding: 1;
-        background: $bg;
-    }
-    
-    #fallback-modal-footer Button {
-        margin: 0 1;
-        min-width: 10;
-    }
 
-    /* === MONITOR & TOOLS PANELS === */
-    #monitor-scroll {
-        height: 1fr;
-        padding: 1;
-        scrollbar-gutter: stable;
-    }
-    
-    #tool-factory-panel {
-        height: 1fr;
-        overflow-y: auto;
-    }
-    
-    #tf-tools-scroll {
-        height: 1fr;
-        min-height: 10;
-        scrollbar-gutter: stable;
-    }
-    
-    TabPane {
-        height: 1fr;
-        overflow: auto;
-    }
-"""
+# CSS Kuralları (Değişken tanımları olmadan)
+BASE_CSS = Path(__file__).with_suffix(".tcss").read_text(encoding="utf-8")
 
 
 
+@lru_cache(maxsize=None)
 def get_css(theme_name="gruvbox"):
     """Full CSS string (variables + rules)"""
-    vars = get_theme_variables(theme_name)
+    vars = _RESOLVED.get(theme_name, _RESOLVED["gruvbox"])
     
     var_lines = []
     for k, v in vars.items():
@@ -1107,5 +300,9 @@ def get_css(theme_name="gruvbox"):
     
     return "\n".join(var_lines) + "\n" + BASE_CSS
 
-# Default CSS for backward compatibility
-APP_CSS = get_css("gruvbox")
+
+def __getattr__(name):
+    # Default CSS for backward compatibility (uygulama kullanmıyor; ilk erişimde oluşturulur)
+    if name == "APP_CSS":
+        return get_css("gruvbox")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
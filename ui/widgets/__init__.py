@@ -1,50 +1,46 @@
 """UI Widgets Package"""
-from ui.widgets.model_selector import ModelSelectorModal, apply_saved_settings
-from ui.widgets.fallback_selector import FallbackSelectorModal
-from ui.widgets.progress_tracker import TaskProgressWidget, ToolActivityWidget
-from ui.widgets.debug_panel import DebugLogWidget, AgentStateWidget, MemoryUsageWidget
-from ui.widgets.code_highlighter import (
-    parse_message_with_code, 
-    highlight_code, 
-    detect_language,
-    simple_highlight,
-    CodeBlockWidget
-)
-from ui.widgets.session_widgets import (
-    SessionBrowserModal,
-    SessionInfoWidget,
-    RenameSessionModal,
-    SessionListItem
-)
-from ui.widgets.session_sidebar import SessionSidebar, SessionItem
-from ui.widgets.sandbox_panel import SandboxPanel
-from ui.widgets.sandbox_tree import SandboxTree
-from ui.widgets.tool_factory_panel import ToolFactoryPanel, ToolItem
+import importlib
 
-__all__ = [
-    "ModelSelectorModal", 
-    "apply_saved_settings", 
-    "FallbackSelectorModal",
-    "TaskProgressWidget",
-    "ToolActivityWidget",
-    "DebugLogWidget",
-    "AgentStateWidget",
-    "MemoryUsageWidget",
-    "parse_message_with_code",
-    "highlight_code",
-    "detect_language",
-    "simple_highlight",
-    "CodeBlockWidget",
+# İsim -> tanımlandığı modül. Alt modüller ilk erişimde yüklenir (PEP 562).
+_LAZY = {
+    "ModelSelectorModal": "ui.widgets.model_selector",
+    "apply_saved_settings": "ui.settings_store",
+    "FallbackSelectorModal": "ui.widgets.fallback_selector",
+    "TaskProgressWidget": "ui.widgets.progress_tracker",
+    "ToolActivityWidget": "ui.widgets.progress_tracker",
+    "DebugLogWidget": "ui.widgets.debug_panel",
+    "AgentStateWidget": "ui.widgets.debug_panel",
+    "MemoryUsageWidget": "ui.widgets.debug_panel",
+    "parse_message_with_code": "ui.widgets.code_highlighter",
+    "highlight_code": "ui.widgets.code_highlighter",
+    "detect_language": "ui.widgets.code_highlighter",
+    "simple_highlight": "ui.widgets.code_highlighter",
+    "CodeBlockWidget": "ui.widgets.code_highlighter",
     # Session widgets
-    "SessionBrowserModal",
-    "SessionInfoWidget",
-    "RenameSessionModal",
-    "SessionListItem",
-    "SessionSidebar",
-    "SessionItem",
-    "SandboxPanel",
-    "SandboxTree",
+    "SessionBrowserModal": "ui.widgets.session_widgets",
+    "SessionInfoWidget": "ui.widgets.session_widgets",
+    "RenameSessionModal": "ui.widgets.session_widgets",
+    "SessionListItem": "ui.widgets.session_widgets",
+    "SessionSidebar": "ui.widgets.session_sidebar",
+    "SessionItem": "ui.widgets.session_sidebar",
+    "SandboxPanel": "ui.widgets.sandbox_panel",
+    "SandboxTree": "ui.widgets.sandbox_tree",
     # Tool Factory
-    "ToolFactoryPanel",
-    "ToolItem"
-]
+    "ToolFactoryPanel": "ui.widgets.tool_factory_panel",
+    "ToolItem": "ui.widgets.tool_factory_panel",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -2,10 +2,8 @@
 Code Highlighter Widget - Chat içindeki kod bloklarını renklendirir
 """
 import re
+from functools import lru_cache
 from rich.text import Text
-from rich.syntax import Syntax
-from rich.console import Console
-from io import StringIO
 
 
 # Dil algılama için pattern'ler
@@ -51,6 +49,32 @@ LANGUAGE_PATTERNS = {
     ]
 }
 
+# Yaygın alias'lar
+_LANG_ALIASES = {
+    "py": "python",
+    "js": "javascript",
+    "ts": "typescript",
+    "sh": "bash",
+    "shell": "bash",
+    "yml": "yaml"
+}
+
+# Hint olarak doğrudan kabul edilen adlar -> dil (tanınmayan hint algılamaya düşer)
+_KNOWN_LANGS = {**{lang: lang for lang in LANGUAGE_PATTERNS}, **_LANG_ALIASES}
+
+# Pattern'ler import sırasında bir kez derlenir; her çağrıda re cache'ine gidilmez.
+# Skor "eşleşen farklı pattern sayısı" olduğu için pattern'ler ayrı tutulur.
+_COMPILED_LANG = {
+    lang: tuple(re.compile(p, re.MULTILINE | re.IGNORECASE) for p in patterns)
+    for lang, patterns in LANGUAGE_PATTERNS.items()
+}
+
+# detect_language bu uzunluğun iki katından uzun kodda yalnızca baş/son kısmı tarar
+_DETECT_SAMPLE_HALF = 2048
+
+# Kod bloğu pattern'i: ```language\ncode\n``` veya ```\ncode\n```
+_CODE_BLOCK_RE = re.compile(r"```(\w*)\n(.*?)```", re.DOTALL)
+
 
 def detect_language(code: str, hint: str = "") -> str:
     """
@@ -65,35 +89,36 @@ def detect_language(code: str, hint: str = "") -> str:
     """
     # Hint varsa önce onu kontrol et
     if hint:
-        hint_lower = hint.lower().strip()
-        # Yaygın alias'lar
-        aliases = {
-            "py": "python",
-            "js": "javascript",
-            "ts": "typescript",
-            "sh": "bash",
-            "shell": "bash",
-            "yml": "yaml"
-        }
-        if hint_lower in aliases:
-            return aliases[hint_lower]
-        if hint_lower in LANGUAGE_PATTERNS:
-            return hint_lower
+        lang = _KNOWN_LANGS.get(hint.lower().strip())
+        if lang:
+            return lang
     
-    # Pattern matching ile algıla
-    scores = {lang: 0 for lang in LANGUAGE_PATTERNS}
+    # Uzun kodlarda baş ve sondan örnek al; çalışma süresi girdi boyutundan bağımsız
+    if len(code) > 2 * _DETECT_SAMPLE_HALF:
+        code = code[:_DETECT_SAMPLE_HALF] + "\n" + code[-_DETECT_SAMPLE_HALF:]
     
-    for lang, patterns in LANGUAGE_PATTERNS.items():
-        for pattern in patterns:
-            if re.search(pattern, code, re.MULTILINE | re.IGNORECASE):
-                scores[lang] += 1
-    
-    # En yüksek skoru bul
-    best_lang = max(scores, key=scores.get)
-    if scores[best_lang] > 0:
-        return best_lang
+    return _detect_from_patterns(code)
+
+
+@lru_cache(maxsize=512)
+def _detect_from_patterns(code: str) -> str:
+    """Pattern skorlarıyla dil algıla; aynı blok tekrar render edilince cache'ten döner."""
+    # Pattern matching ile algıla (eşitlikte önceki dil kazanır)
+    best_lang, best_score = "text", 0
+    for lang, patterns in _COMPILED_LANG.items():
+        score = 0
+        remaining = len(patterns)
+        for rx in patterns:
+            # Kalan pattern'lerin hepsi eşleşse bile lideri geçemiyorsa dur
+            if score + remaining <= best_score:
+                break
+            remaining -= 1
+            if rx.search(code):
+                score += 1
+        if score > best_score:
+            best_lang, best_score = lang, score
     
-    return "text"
+    return best_lang
 
 
 def highlight_code(code: str, language: str = "") -> Text:
@@ -110,24 +135,11 @@ def highlight_code(code: str, language: str = "") -> Text:
     if not language:
         language = detect_language(code)
     
-    try:
-        syntax = Syntax(
-            code,
-            language,
-            theme="monokai",
-            line_numbers=False,
-            word_wrap=True
-        )
-        
-        # Syntax'ı Text'e çevir
-        console = Console(file=StringIO(), force_terminal=True)
-        console.print(syntax)
-        
-        # Rich Text olarak döndür
-        return Text.from_markup(f"[dim]```{language}[/dim]\n") + Text(code) + Text("\n[dim]```[/dim]")
-    except:
-        # Fallback: düz text
-        return Text(f"```{language}\n{code}\n```")
+    return Text.assemble(
+        (f"```{language}", "dim"), "\n",
+        simple_highlight(code, language),
+        "\n", ("```", "dim"),
+    )
 
 
 def parse_message_with_code(message: str) -> Text:
@@ -140,16 +152,14 @@ def parse_message_with_code(message: str) -> Text:
     Returns:
         Rich Text objesi
     """
-    result = Text()
-    
-    # Kod bloğu pattern'i: ```language\ncode\n``` veya ```\ncode\n```
-    code_block_pattern = r"```(\w*)\n(.*?)```"
+    # (parça, stil) listesi toplanıp Text'e tek seferde eklenir
+    parts = []
     
     last_end = 0
-    for match in re.finditer(code_block_pattern, message, re.DOTALL):
+    for match in _CODE_BLOCK_RE.finditer(message):
         # Kod bloğundan önceki text
         if match.start() > last_end:
-            result.append(message[last_end:match.start()])
+            parts.append((message[last_end:match.start()], None))
         
         # Kod bloğu
         language = match.group(1) or ""
@@ -160,21 +170,77 @@ def parse_message_with_code(message: str) -> Text:
             language = detect_language(code)
         
         # Kod bloğunu ekle
-        result.append(f"\n[dim]```{language}[/dim]\n", style="dim")
+        parts.append((f"\n[dim]```{language}[/dim]\n", "dim"))
         
         # Basit syntax highlighting
-        highlighted = simple_highlight(code, language)
-        result.append_text(highlighted)
+        parts.extend(_highlight_parts(code, language))
         
-        result.append("\n[dim]```[/dim]\n", style="dim")
+        parts.append(("\n[dim]```[/dim]\n", "dim"))
         
         last_end = match.end()
     
     # Kalan text
     if last_end < len(message):
-        result.append(message[last_end:])
+        parts.append((message[last_end:], None))
+    
+    return Text().append_tokens(parts)
+
+
+# simple_highlight için dile göre keyword'ler
+_KEYWORDS = {
+    "python": frozenset({
+        "def", "class", "import", "from", "if", "else", "elif",
+        "for", "while", "try", "except", "finally", "with", "as",
+        "return", "yield", "raise", "pass", "break", "continue",
+        "and", "or", "not", "in", "is", "None", "True", "False",
+        "async", "await", "lambda", "global", "nonlocal",
+    }),
+    "javascript": frozenset({
+        "function", "const", "let", "var", "if", "else",
+        "for", "while", "do", "switch", "case", "break",
+        "return", "try", "catch", "finally", "throw",
+        "class", "extends", "new", "this", "super",
+        "import", "export", "default", "async", "await",
+        "true", "false", "null", "undefined",
+    }),
+    "bash": frozenset({
+        "if", "then", "else", "fi", "for", "do", "done", "while",
+        "case", "esac", "function", "return", "exit", "echo",
+        "export", "source", "alias",
+    }),
+}
+
+# Boşluk ve ayraçlar (){}[]:,. dışında kalan kelime parçaları
+_WORD_RE = re.compile(r"[^\s(){}[\]:,.]+")
+
+
+def _scan_line(line: str, keywords: frozenset):
+    """
+    Satırı tek geçişte tara, (parça, stil) çiftleri üret.
     
-    return result
+    Boşluk/ayraçlar hiçbir zaman stillenmediği için yalnızca kelimeler
+    sınıflandırılır; stilsiz parçalar tek bir parça olarak birleştirilir.
+    """
+    last = 0
+    for match in _WORD_RE.finditer(line):
+        word = match.group()
+        if word in keywords:
+            style = "bold magenta"
+        elif word[0] in "\"'":
+            style = "yellow"
+        elif word.isdigit():
+            style = "cyan"
+        elif word[0] == "@":
+            style = "blue"
+        else:
+            continue
+        start = match.start()
+        if start > last:
+            yield line[last:start], None
+        yield word, style
+        last = match.end()
+    if last < len(line):
+        yield line[last:], None
 
 
 def simple_highlight(code: str, language: str) -> Text:
@@ -189,58 +255,33 @@ def simple_highlight(code: str, language: str) -> Text:
     Returns:
         Rich Text
     """
-    text = Text()
-    
-    # Dile göre keyword'ler
-    keywords = {
-        "python": ["def", "class", "import", "from", "if", "else", "elif", 
-                   "for", "while", "try", "except", "finally", "with", "as",
-                   "return", "yield", "raise", "pass", "break", "continue",
-                   "and", "or", "not", "in", "is", "None", "True", "False",
-                   "async", "await", "lambda", "global", "nonlocal"],
-        "javascript": ["function", "const", "let", "var", "if", "else",
-                       "for", "while", "do", "switch", "case", "break",
-                       "return", "try", "catch", "finally", "throw",
-                       "class", "extends", "new", "this", "super",
-                       "import", "export", "default", "async", "await",
-                       "true", "false", "null", "undefined"],
-        "bash": ["if", "then", "else", "fi", "for", "do", "done", "while",
-                 "case", "esac", "function", "return", "exit", "echo",
-                 "export", "source", "alias"],
-    }
-    
-    lang_keywords = keywords.get(language, [])
+    return Text().append_tokens(_highlight_parts(code, language))
+
+
+def _highlight_parts(code: str, language: str) -> list:
+    """simple_highlight'ın (parça, stil) listesi; mesaj render'ı doğrudan bunu kullanır"""
+    lang_keywords = _KEYWORDS.get(language, frozenset())
     
+    parts = []
     lines = code.split("\n")
     for i, line in enumerate(lines):
         if i > 0:
-            text.append("\n")
+            parts.append(("\n", None))
         
         # Yorum satırı
-        if line.strip().startswith("#") or line.strip().startswith("//"):
-            text.append(line, style="dim green")
+        if line.lstrip().startswith(("#", "//")):
+            parts.append((line, "dim green"))
             continue
         
         # String'ler
         if '"""' in line or "'''" in line:
-            text.append(line, style="yellow")
+            parts.append((line, "yellow"))
             continue
         
         # Keyword highlighting
-        words = re.split(r'(\s+|[(){}[\]:,.])', line)
-        for word in words:
-            if word in lang_keywords:
-                text.append(word, style="bold magenta")
-            elif word.startswith('"') or word.startswith("'"):
-                text.append(word, style="yellow")
-            elif word.isdigit():
-                text.append(word, style="cyan")
-            elif word.startswith("@"):
-                text.append(word, style="blue")
-            else:
-                text.append(word)
+        parts.extend(_scan_line(line, lang_keywords))
     
-    return text
+    return parts
 
 
 class CodeBlockWidget:
@@ -255,9 +296,7 @@ class CodeBlockWidget:
             List of (language, code) tuples
         """
         blocks = []
-        pattern = r"```(\w*)\n(.*?)```"
-        
-        for match in re.finditer(pattern, text, re.DOTALL):
+        for match in _CODE_BLOCK_RE.finditer(text):
             language = match.group(1) or detect_language(match.group(2))
             code = match.group(2).strip()
             blocks.append((language, code))
@@ -4,6 +4,7 @@ Debug Panel Widget - Agent aktivitelerini ve logları gösterir
 from textual.widgets import Static, RichLog
 from textual.containers import Vertical
 from rich.text import Text
+import time
 from datetime import datetime
 from collections import deque
 
@@ -13,6 +14,8 @@ class DebugLogWidget(RichLog):
     
     def __init__(self, max_lines: int = 100, **kwargs):
         super().__init__(max_lines=max_lines, wrap=True, highlight=True, **kwargs)
+        # (time, level, message) tuple'ları; RichLog satırları sarılmış Strip olarak
+        # tuttuğu için seviye/mesaj oradan geri okunamaz
         self.log_history = deque(maxlen=max_lines)
     
     def log_info(self, message: str):
@@ -46,33 +49,57 @@ class DebugLogWidget(RichLog):
     
     def _add_log(self, level: str, message: str, color: str):
         """Log ekle"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        timestamp = time.strftime("%H:%M:%S")
         
-        text = Text()
-        text.append(f"[{timestamp}] ", style="dim")
-        text.append(f"[{level}] ", style=f"bold {color}")
-        text.append(message)
-        
-        self.write(text)
-        self.log_history.append({
-            "time": timestamp,
-            "level": level,
-            "message": message
-        })
+        # Tek seferde kurulan Text; markup parse'ı ve highlighter'a girmez
+        self.write(Text.assemble(
+            (f"[{timestamp}] ", "dim"),
+            (f"[{level}] ", f"bold {color}"),
+            message,
+        ))
+        self.log_history.append((timestamp, level, message))
     
     def get_recent_logs(self, count: int = 10) -> list:
         """Son logları döndür"""
-        return list(self.log_history)[-count:]
+        return [
+            {"time": timestamp, "level": level, "message": message}
+            for timestamp, level, message in list(self.log_history)[-count:]
+        ]
     
     def export_logs(self) -> str:
         """Logları text olarak export et"""
-        lines = []
-        for log in self.log_history:
-            lines.append(f"[{log['time']}] [{log['level']}] {log['message']}")
-        return "\n".join(lines)
+        return "\n".join(
+            f"[{timestamp}] [{level}] {message}"
+            for timestamp, level, message in self.log_history
+        )
+
+
+# AgentStateWidget görünüm tabloları
+_STATUS_VIEW = {
+    "idle": ("⚪ Boşta\n", "dim"),
+    "thinking": ("🟡 Düşünüyor\n", "yellow"),
+    "working": ("🟢 Çalışıyor\n", "green"),
+    "error": ("🔴 Hata\n", "red"),
+}
+_ROLE_ICONS = {"supervisor": "👔", "coder": "💻", "researcher": "🔍"}
+_ROLE_NAMES = {"supervisor": "Supervisor", "coder": "Coder", "researcher": "Researcher"}
+
+
+class _DeferredRenderMixin:
+    """Art arda gelen güncellemeleri 100ms içinde tek bir render'a toplar"""
+    
+    _render_timer = None
+    
+    def _schedule_render(self) -> None:
+        if self._render_timer is None:
+            self._render_timer = self.set_timer(0.1, self._flush_render)
+    
+    def _flush_render(self) -> None:
+        self._render_timer = None
+        self._update_display()
 
 
-class AgentStateWidget(Static):
+class AgentStateWidget(_DeferredRenderMixin, Static):
     """Agent durumunu gösteren widget"""
     
     def __init__(self, **kwargs):
@@ -94,38 +121,38 @@ class AgentStateWidget(Static):
         """Boşta durumuna geç"""
         self.state["status"] = "idle"
         self.state["current_task"] = None
-        self._update_display()
+        self._schedule_render()
     
     def set_thinking(self, task: str = ""):
         """Düşünüyor durumuna geç"""
         self.state["status"] = "thinking"
         self.state["current_task"] = task
         self.state["start_time"] = datetime.now()
-        self._update_display()
+        self._schedule_render()
     
     def set_working(self, task: str = ""):
         """Çalışıyor durumuna geç"""
         self.state["status"] = "working"
         self.state["current_task"] = task
-        self._update_display()
+        self._schedule_render()
     
     def set_error(self, error: str = ""):
         """Hata durumuna geç"""
         self.state["status"] = "error"
         self.state["errors"] += 1
-        self._update_display()
+        self._schedule_render()
     
     def increment_tools(self):
         """Tool sayacını artır"""
         self.state["tools_used"] += 1
-        self._update_display()
+        self._schedule_render()
     
     def reset_stats(self):
         """İstatistikleri sıfırla"""
         self.state["tools_used"] = 0
         self.state["errors"] = 0
         self.state["start_time"] = None
-        self._update_display()
+        self._schedule_render()
     
     def update_models(self):
         """Model bilgilerini güncelle"""
@@ -141,7 +168,7 @@ class AgentStateWidget(Static):
                     self.models[role] = (provider, short_model)
         except:
             pass
-        self._update_display()
+        self._schedule_render()
     
     def _update_display(self):
         """Görüntüyü güncelle"""
@@ -149,19 +176,11 @@ class AgentStateWidget(Static):
         text.append("🤖 Agent Durumu\n", style="bold cyan")
         
         # Status
-        status = self.state["status"]
-        if status == "idle":
-            text.append("  Durum: ", style="dim")
-            text.append("⚪ Boşta\n", style="dim")
-        elif status == "thinking":
+        status_view = _STATUS_VIEW.get(self.state["status"])
+        if status_view:
+            label, style = status_view
             text.append("  Durum: ", style="dim")
-            text.append("🟡 Düşünüyor\n", style="yellow")
-        elif status == "working":
-            text.append("  Durum: ", style="dim")
-            text.append("🟢 Çalışıyor\n", style="green")
-        elif status == "error":
-            text.append("  Durum: ", style="dim")
-            text.append("🔴 Hata\n", style="red")
+            text.append(label, style=style)
         
         # Current task
         if self.state["current_task"]:
@@ -181,8 +200,8 @@ class AgentStateWidget(Static):
         # Model bilgileri
         text.append("\n\n🔧 Aktif Modeller\n", style="bold cyan")
         for role, (provider, model) in self.models.items():
-            role_icon = {"supervisor": "👔", "coder": "💻", "researcher": "🔍"}.get(role, "•")
-            role_name = {"supervisor": "Supervisor", "coder": "Coder", "researcher": "Researcher"}.get(role, role)
+            role_icon = _ROLE_ICONS.get(role, "•")
+            role_name = _ROLE_NAMES.get(role, role)
             
             if provider != "unknown":
                 text.append(f"  {role_icon} {role_name}: ", style="dim")
@@ -195,7 +214,15 @@ class AgentStateWidget(Static):
         self.update(text)
 
 
-class MemoryUsageWidget(Static):
+# Token bar: doluluk oranına göre renk eşikleri ve olası tüm (dolu, boş) parçaları
+_MAX_TOKENS = 8000
+_BAR_WIDTH = 15
+_BAR_RED_PCT = 0.8
+_BAR_YELLOW_PCT = 0.5
+_BARS = tuple(("█" * f, "░" * (_BAR_WIDTH - f)) for f in range(_BAR_WIDTH + 1))
+
+
+class MemoryUsageWidget(_DeferredRenderMixin, Static):
     """Memory/Context kullanımını gösteren widget"""
     
     def __init__(self, **kwargs):
@@ -211,7 +238,7 @@ class MemoryUsageWidget(Static):
         self.usage["messages"] = messages
         self.usage["tokens_estimate"] = tokens
         self.usage["rag_chunks"] = rag_chunks
-        self._update_display()
+        self._schedule_render()
     
     def _update_display(self):
         """Görüntüyü güncelle"""
@@ -226,22 +253,20 @@ class MemoryUsageWidget(Static):
         tokens = self.usage["tokens_estimate"]
         if tokens > 0:
             # Token bar (max 8000 varsayalım)
-            max_tokens = 8000
-            usage_pct = min(tokens / max_tokens, 1.0)
-            bar_width = 15
-            filled = int(bar_width * usage_pct)
+            usage_pct = min(tokens / _MAX_TOKENS, 1.0)
+            filled, empty = _BARS[int(_BAR_WIDTH * usage_pct)]
             
             text.append("  Tokens: [", style="dim")
             
-            if usage_pct > 0.8:
+            if usage_pct > _BAR_RED_PCT:
                 bar_color = "red"
-            elif usage_pct > 0.5:
+            elif usage_pct > _BAR_YELLOW_PCT:
                 bar_color = "yellow"
             else:
                 bar_color = "green"
             
-            text.append("█" * filled, style=bar_color)
-            text.append("░" * (bar_width - filled), style="dim")
+            text.append(filled, style=bar_color)
+            text.append(empty, style="dim")
             text.append(f"] ~{tokens}\n", style="dim")
         
         # RAG chunks
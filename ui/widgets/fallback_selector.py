@@ -2,42 +2,21 @@
 Fallback Selector Widget - Clean Modal for Fallback Configuration
 v2.1 - Reads from .atom_fallback.json, all 6 roles, 5 fallbacks each
 """
-import json
-import os
+from rich.table import Table
+from rich.text import Text
 from textual.app import ComposeResult
 from textual.containers import Vertical, Horizontal, VerticalScroll
 from textual.screen import ModalScreen
 from textual.widgets import Static, Button, Select, Input
 
-from core.providers import PROVIDERS, get_provider_names, model_manager
+from core.providers import model_manager
+from ui.settings_store import load_fallbacks, save_fallbacks_to_file, provider_options
 
-# Fallback file in project root (not workspace)
-FALLBACK_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), ".atom_fallback.json")
 
-
-def load_fallbacks() -> dict:
-    """Load fallbacks from .atom_fallback.json"""
-    try:
-        if os.path.exists(FALLBACK_FILE):
-            with open(FALLBACK_FILE, "r") as f:
-                return json.load(f)
-    except Exception:
-        pass
-    return {}
-
-
-def save_fallbacks_to_file(data: dict):
-    """Save fallbacks to .atom_fallback.json"""
-    try:
-        with open(FALLBACK_FILE, "w") as f:
-            json.dump(data, f, indent=2)
-    except Exception as e:
-        print(f"Fallback save error: {e}")
-
-
-def get_role_fallbacks(role: str) -> list:
-    """Get fallback list for a role from .atom_fallback.json"""
-    data = load_fallbacks()
+def get_role_fallbacks(role: str, data: dict = None) -> list:
+    """Get fallback list for a role from .atom_fallback.json (or pre-loaded data)"""
+    if data is None:
+        data = load_fallbacks()
     if role in data and "fallbacks" in data[role]:
         return data[role]["fallbacks"]
     return []
@@ -52,6 +31,15 @@ def get_primary_model(role: str) -> str:
     return "?"
 
 
+def _card_header(title: str, primary: str) -> Table:
+    """Kart başlığı: solda rol, sağda ana model"""
+    grid = Table.grid(expand=True)
+    grid.add_column()
+    grid.add_column(justify="right")
+    grid.add_row(Text(title, style="bold"), Text(f"Ana: {primary}", style="dim"))
+    return grid
+
+
 ROLE_INFO = {
     "supervisor": ("🎯", "Supervisor"),
     "coder": ("💻", "Coder"),
@@ -65,12 +53,22 @@ ROLE_INFO = {
 ALL_ROLES = ["supervisor", "coder", "researcher", "vision", "audio", "tts"]
 MAX_FALLBACKS = 5
 
+# Her açılışta aynı olan etiketler import sırasında bir kez hazırlanır
+_ROLE_TITLES = {role: f"{icon} {name}" for role, (icon, name) in ROLE_INFO.items()}
+_INDEX_LABELS = tuple(f"#{i + 1}" for i in range(MAX_FALLBACKS))
+
 
 class FallbackSelectorModal(ModalScreen):
     """Modern modal for fallback configuration - all 6 roles, 5 fallbacks each"""
     
     BINDINGS = [("escape", "cancel", "Kapat")]
     
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # (role, index) -> widget; kaydet/temizle DOM sorgusu yapmadan erişir
+        self._selects = {}
+        self._inputs = {}
+    
     def compose(self) -> ComposeResult:
         with Vertical(id="fallback-modal"):
             # Header
@@ -85,16 +83,17 @@ class FallbackSelectorModal(ModalScreen):
             )
             
             with VerticalScroll(id="fallback-list"):
+                data = load_fallbacks()
                 for role in ALL_ROLES:
-                    fallbacks = get_role_fallbacks(role)
-                    icon, name = ROLE_INFO[role]
+                    fallbacks = get_role_fallbacks(role, data)
                     primary = get_primary_model(role)
                     
                     with Vertical(classes="fallback-card"):
-                        # Card Header - Ana model bilgisi
-                        with Horizontal(classes="fallback-card-header"):
-                            yield Static(f"{icon} {name}", classes="fallback-card-title")
-                            yield Static(f"[dim]Ana: {primary}[/dim]", classes="fallback-primary-info")
+                        # Card Header - Ana model bilgisi (tek widget)
+                        yield Static(
+                            _card_header(_ROLE_TITLES[role], primary),
+                            classes="fallback-card-header"
+                        )
                         
                         # 5 Fallback Rows
                         for i in range(MAX_FALLBACKS):
@@ -102,22 +101,24 @@ class FallbackSelectorModal(ModalScreen):
                             fb_model = fallbacks[i]["model"] if i < len(fallbacks) else ""
                             
                             with Horizontal(classes="fallback-row"):
-                                yield Static(f"#{i+1}", classes="fallback-index")
-                                
-                                provider_opts = [(PROVIDERS[p].name, p) for p in get_provider_names()]
-                                yield Select(
-                                    provider_opts,
+                                yield Static(_INDEX_LABELS[i], classes="fallback-index")
+                                select = Select(
+                                    provider_options(),
                                     value=fb_provider,
                                     id=f"fb-provider-{role}-{i}",
                                     classes="fallback-select"
                                 )
+                                self._selects[(role, i)] = select
+                                yield select
                                 
-                                yield Input(
+                                model_input = Input(
                                     value=fb_model,
                                     placeholder="Model adı (boş = devre dışı)",
                                     id=f"fb-model-{role}-{i}",
                                     classes="fallback-input"
                                 )
+                                self._inputs[(role, i)] = model_input
+                                yield model_input
             
             # Footer
             with Horizontal(id="fallback-modal-footer"):
@@ -126,19 +127,18 @@ class FallbackSelectorModal(ModalScreen):
                 yield Button("İptal", id="btn-cancel", variant="default")
     
     def on_button_pressed(self, event: Button.Pressed) -> None:
-        btn_id = event.button.id
-        
-        if btn_id == "btn-save":
-            self._save_fallbacks()
-            self.app.notify("✓ Yedek model ayarları kaydedildi!", severity="information")
-            self.dismiss(True)
-        
-        elif btn_id == "btn-reset":
-            self._reset_fallbacks()
-            self.app.notify("Yedek ayarları temizlendi", severity="warning")
-        
-        elif btn_id in ["btn-cancel", "btn-close"]:
-            self.dismiss(False)
+        handler = self._BUTTON_ACTIONS.get(event.button.id)
+        if handler:
+            handler(self)
+    
+    def _on_save_pressed(self):
+        self._save_fallbacks()
+        self.app.notify("✓ Yedek model ayarları kaydedildi!", severity="information")
+        self.dismiss(True)
+    
+    def _on_reset_pressed(self):
+        self._reset_fallbacks()
+        self.app.notify("Yedek ayarları temizlendi", severity="warning")
     
     def action_cancel(self):
         self.dismiss(False)
@@ -151,15 +151,12 @@ class FallbackSelectorModal(ModalScreen):
             fallbacks = []
             
             for i in range(MAX_FALLBACKS):
-                try:
-                    provider = self.query_one(f"#fb-provider-{role}-{i}", Select).value
-                    model = self.query_one(f"#fb-model-{role}-{i}", Input).value.strip()
-                    
-                    # Sadece model belirtilmişse ekle
-                    if model:
-                        fallbacks.append({"provider": provider, "model": model})
-                except:
-                    pass
+                provider = self._selects[(role, i)].value
+                model = self._inputs[(role, i)].value.strip()
+                
+                # Sadece model belirtilmişse ekle
+                if model:
+                    fallbacks.append({"provider": provider, "model": model})
             
             data[role] = {"fallbacks": fallbacks}
             
@@ -172,10 +169,15 @@ class FallbackSelectorModal(ModalScreen):
         """Tüm fallback inputlarını temizle"""
         for role in ALL_ROLES:
             for i in range(MAX_FALLBACKS):
-                try:
-                    self.query_one(f"#fb-provider-{role}-{i}", Select).value = "ollama"
-                    self.query_one(f"#fb-model-{role}-{i}", Input).value = ""
-                except:
-                    pass
+                self._selects[(role, i)].value = "ollama"
+                self._inputs[(role, i)].value = ""
             
             model_manager.set_fallbacks(role, [])
+    
+    # button id -> handler (sınıf tanımında bir kez oluşturulur)
+    _BUTTON_ACTIONS = {
+        "btn-save": _on_save_pressed,
+        "btn-reset": _on_reset_pressed,
+        "btn-cancel": action_cancel,
+        "btn-close": action_cancel,
+    }
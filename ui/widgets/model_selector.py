@@ -2,59 +2,21 @@
 Model Selector Widget - Clean Modal for LLM Configuration
 v2.1 - Reads from .atom_settings.json, all 6 roles
 """
-import json
-import os
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from textual.app import ComposeResult
 from textual.containers import Vertical, Horizontal, VerticalScroll
 from textual.widgets import Static, Button, Select, Input
 from textual.screen import ModalScreen
 
-from core.providers import PROVIDERS, get_provider_names, model_manager, create_llm, check_api_key
+from core.providers import PROVIDERS, model_manager, create_llm, check_api_key
+from ui.settings_store import load_settings, save_settings, provider_options
 
-# Settings file in project root (not workspace)
-SETTINGS_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), ".atom_settings.json")
 
-
-def load_settings() -> dict:
-    """Load settings from JSON file"""
-    try:
-        if os.path.exists(SETTINGS_FILE):
-            with open(SETTINGS_FILE, "r") as f:
-                return json.load(f)
-    except Exception:
-        pass
-    return {}
-
-
-def save_settings(settings: dict):
-    """Save settings to JSON file"""
-    try:
-        with open(SETTINGS_FILE, "w") as f:
-            json.dump(settings, f, indent=2)
-    except Exception as e:
-        print(f"Settings save error: {e}")
-
-
-def apply_saved_settings():
-    """Apply saved settings to model_manager on startup"""
-    settings = load_settings()
-    models = settings.get("models", {})
-    
-    for role in model_manager.ROLES:
-        if role in models:
-            cfg = models[role]
-            model_manager.set_model(
-                role, 
-                cfg.get("provider", "ollama"),
-                cfg.get("model", "llama3.2"),
-                cfg.get("temperature", 0.0)
-            )
-
-
-def get_model_from_settings(role: str) -> tuple:
-    """Get provider and model from .atom_settings.json"""
-    settings = load_settings()
+def get_model_from_settings(role: str, settings: dict = None) -> tuple:
+    """Get provider and model from .atom_settings.json (or pre-loaded settings)"""
+    if settings is None:
+        settings = load_settings()
     models = settings.get("models", {})
     if role in models:
         return models[role].get("provider", "ollama"), models[role].get("model", "llama3.2")
@@ -78,6 +40,16 @@ def get_api_status(provider: str) -> tuple:
     return "🔴", "Key yok"
 
 
+def _run_model_test(provider: str, model: str):
+    """Modeli oluştur ve kısa bir istek gönder (executor thread'inde çalışır)"""
+    llm = create_llm(provider, model, temperature=0.7)
+    if not llm:
+        return None
+    
+    from langchain_core.messages import HumanMessage
+    return llm.invoke([HumanMessage(content="Say 'OK' only.")])
+
+
 ROLE_INFO = {
     "supervisor": ("🎯", "Supervisor", "Ana koordinatör"),
     "coder": ("💻", "Coder", "Kod yazma"),
@@ -87,15 +59,40 @@ ROLE_INFO = {
     "tts": ("🔊", "TTS", "Metin okuma")
 }
 
+# Provider Select id'leri: provider-{role}
+_PROVIDER_ID_PREFIX = "provider-"
+
+# Test butonunun bir yanıt için bekleyeceği süre (saniye)
+MODEL_TEST_TIMEOUT = 15.0
+
 # Tüm roller
 ALL_ROLES = ["supervisor", "coder", "researcher", "vision", "audio", "tts"]
 
+# Ana roller: tam kart stili ve test butonu alır
+PRIMARY_ROLES = frozenset({"supervisor", "coder", "researcher"})
+
 
 class ModelSelectorModal(ModalScreen):
     """Modern modal for model selection - all 6 roles"""
     
     BINDINGS = [("escape", "cancel", "Kapat")]
     
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # role -> widget; kaydet/test/select olayları DOM sorgusu yapmadan erişir
+        self._selects = {}
+        self._inputs = {}
+        self._statuses = {}
+        # role -> status Static'te şu an görünen metin
+        self._status_texts = {}
+        self._results = {}
+        self._test_buttons = {}
+        # Model testleri için sınırlı thread havuzu (test butonuna art arda basılsa bile)
+        self._test_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="modeltest")
+        # Testler tek worker'da sırayla çalışır; buton test bitene kadar kapalı
+        # olduğundan kuyrukta rol başına en fazla bir istek bulunur
+        self._test_queue = asyncio.Queue(maxsize=len(PRIMARY_ROLES))
+    
     def compose(self) -> ComposeResult:
         with Vertical(id="model-modal"):
             # Header
@@ -109,48 +106,66 @@ class ModelSelectorModal(ModalScreen):
                 id="model-modal-info"
             )
             
+            # Aynı provider'ın key durumu compose boyunca değişmez
+            status_cache = {}
+            
             # Model List - All 6 roles
             with VerticalScroll(id="model-list"):
+                settings = load_settings()
                 for role in ALL_ROLES:
-                    provider, model = get_model_from_settings(role)
+                    provider, model = get_model_from_settings(role, settings)
                     icon, name, desc = ROLE_INFO[role]
-                    status_icon, status_text = get_api_status(provider)
+                    status = status_cache.get(provider)
+                    if status is None:
+                        status = status_cache[provider] = get_api_status(provider)
+                    status_icon, status_text = status
                     
                     # Multimodal roller için farklı stil
-                    card_class = "model-card" if role in ["supervisor", "coder", "researcher"] else "model-card model-card-secondary"
+                    card_class = "model-card" if role in PRIMARY_ROLES else "model-card model-card-secondary"
                     
                     with Vertical(classes=card_class):
                         # Card Header
                         with Horizontal(classes="model-card-header"):
                             yield Static(f"{icon} {name}", classes="model-card-title")
-                            yield Static(f"{status_icon} {status_text}", id=f"status-{role}", classes="model-card-status")
+                            status_line = f"{status_icon} {status_text}"
+                            status_widget = Static(status_line, id=f"status-{role}", classes="model-card-status")
+                            self._statuses[role] = status_widget
+                            self._status_texts[role] = status_line
+                            yield status_widget
                         
                         # Provider Row
                         with Horizontal(classes="model-card-row"):
                             yield Static("Provider:", classes="model-label")
-                            provider_opts = [(PROVIDERS[p].name, p) for p in get_provider_names()]
-                            yield Select(
-                                provider_opts,
+                            select = Select(
+                                provider_options(),
                                 value=provider,
-                                id=f"provider-{role}",
+                                id=f"{_PROVIDER_ID_PREFIX}{role}",
                                 classes="model-select"
                             )
+                            self._selects[role] = select
+                            yield select
                         
                         # Model Row
                         with Horizontal(classes="model-card-row"):
                             yield Static("Model:", classes="model-label")
-                            yield Input(
+                            model_input = Input(
                                 value=model,
                                 placeholder="Model adı...",
                                 id=f"model-{role}",
                                 classes="model-input"
                             )
+                            self._inputs[role] = model_input
+                            yield model_input
                         
                         # Test Button (sadece ana roller için)
-                        if role in ["supervisor", "coder", "researcher"]:
+                        if role in PRIMARY_ROLES:
                             with Horizontal(classes="model-card-actions"):
-                                yield Button("🧪 Test", id=f"test-{role}", variant="default", classes="test-btn")
-                                yield Static("", id=f"result-{role}", classes="test-result")
+                                test_button = Button("🧪 Test", id=f"test-{role}", variant="default", classes="test-btn")
+                                self._test_buttons[role] = test_button
+                                yield test_button
+                                result_widget = Static("", id=f"result-{role}", classes="test-result")
+                                self._results[role] = result_widget
+                                yield result_widget
             
             # Footer Buttons
             with Horizontal(id="model-modal-footer"):
@@ -159,97 +174,121 @@ class ModelSelectorModal(ModalScreen):
     
     def on_select_changed(self, event: Select.Changed) -> None:
         """Provider değiştiğinde status güncelle"""
-        if not event.select.id or not event.select.id.startswith("provider-"):
+        # id: provider-{role}
+        select_id = event.select.id
+        if not select_id or not select_id.startswith(_PROVIDER_ID_PREFIX):
             return
         
-        role = event.select.id.replace("provider-", "")
+        role = select_id[len(_PROVIDER_ID_PREFIX):]
+        if role not in self._selects:
+            return
         provider = event.value
         
         # Status güncelle
         status_icon, status_text = get_api_status(provider)
-        try:
-            self.query_one(f"#status-{role}", Static).update(f"{status_icon} {status_text}")
-            # Test sonucunu temizle
-            result = self.query_one(f"#result-{role}", Static)
+        status = f"{status_icon} {status_text}"
+        # Aynı metin tekrar yazılmaz (gereksiz yeniden render)
+        if self._status_texts.get(role) != status:
+            self._status_texts[role] = status
+            self._statuses[role].update(status)
+        # Test sonucunu temizle (test butonu yalnızca ana rollerde var)
+        result = self._results.get(role)
+        if result is not None:
             result.update("")
-        except:
-            pass
         
         # Default model öner (sadece boşsa)
         provider_cfg = PROVIDERS.get(provider)
         if provider_cfg and provider_cfg.default_model:
+            model_input = self._inputs[role]
+            if not model_input.value:
+                model_input.value = provider_cfg.default_model
+    
+    def on_mount(self) -> None:
+        self.run_worker(self._test_consumer(), exclusive=True)
+    
+    async def _test_consumer(self):
+        """Kuyruktaki test isteklerini sırayla işle"""
+        while True:
+            role = await self._test_queue.get()
             try:
-                model_input = self.query_one(f"#model-{role}", Input)
-                if not model_input.value:
-                    model_input.value = provider_cfg.default_model
-            except:
-                pass
+                await self._test_model(role)
+            finally:
+                self._test_queue.task_done()
     
     async def _test_model(self, role: str):
         """Model bağlantısını test et"""
-        try:
-            provider = self.query_one(f"#provider-{role}", Select).value
-            model = self.query_one(f"#model-{role}", Input).value.strip()
-            result_widget = self.query_one(f"#result-{role}", Static)
-        except:
-            return
-        
-        if not provider or not model:
-            self.app.notify("Provider veya model eksik", severity="error")
-            return
-        
-        result_widget.update("⏳")
+        result_widget = self._results[role]
+        button = self._test_buttons[role]
+        provider = self._selects[role].value
+        model = self._inputs[role].value.strip()
         
         try:
-            llm = create_llm(provider, model, temperature=0.7)
-            if not llm:
-                result_widget.update("❌")
-                self.app.notify("Model oluşturulamadı", severity="error")
+            if not provider or not model:
+                result_widget.update("")
+                self.app.notify("Provider veya model eksik", severity="error")
                 return
             
-            from langchain_core.messages import HumanMessage
-            response = await asyncio.to_thread(
-                llm.invoke,
-                [HumanMessage(content="Say 'OK' only.")]
+            # Sınırlı executor + timeout: takılan provider thread biriktirmez.
+            # Provider SDK'sının ilk importu da UI thread'i dışında kalır.
+            loop = asyncio.get_running_loop()
+            response = await asyncio.wait_for(
+                loop.run_in_executor(self._test_executor, _run_model_test, provider, model),
+                timeout=MODEL_TEST_TIMEOUT
             )
+            if response is None:
+                result_widget.update("❌")
+                self.app.notify("Model oluşturulamadı", severity="error")
+                return
             
             result_widget.update("✅")
             self.app.notify(f"✓ {role}: {response.content.strip()[:30]}", severity="information")
             
+        except asyncio.TimeoutError:
+            result_widget.update("⌛")
+            self.app.notify(f"{role}: {MODEL_TEST_TIMEOUT:.0f}s içinde yanıt yok", severity="warning")
         except Exception as e:
             result_widget.update("❌")
             self.app.notify(f"Hata: {str(e)[:80]}", severity="error")
+        finally:
+            button.disabled = False
     
     def on_button_pressed(self, event: Button.Pressed) -> None:
         btn_id = event.button.id
+        if not btn_id:
+            return
         
-        # Test butonları
-        if btn_id and btn_id.startswith("test-"):
-            role = btn_id.replace("test-", "")
-            self.run_worker(self._test_model(role))
+        # Test butonları: test-{role}
+        if btn_id.startswith("test-"):
+            role = btn_id[5:]
+            # Test bitene kadar aynı rol tekrar kuyruğa girmesin
+            # (devre dışı kalmadan önce gönderilmiş basışlar da yok sayılır)
+            if role in self._test_buttons and not event.button.disabled:
+                event.button.disabled = True
+                self._results[role].update("⏳")
+                self._test_queue.put_nowait(role)
             return
         
-        if btn_id == "btn-save":
-            self._save_settings()
-        elif btn_id in ["btn-cancel", "btn-close"]:
-            self.dismiss(False)
+        handler = self._BUTTON_ACTIONS.get(btn_id)
+        if handler:
+            handler(self)
     
     def action_cancel(self):
         self.dismiss(False)
     
+    def on_unmount(self) -> None:
+        # Yanıt bekleyen testler arka planda bitsin, kuyruktakiler iptal
+        self._test_executor.shutdown(wait=False, cancel_futures=True)
+    
     def _save_settings(self):
         """Ayarları .atom_settings.json'a kaydet"""
         # Mevcut ayarları yükle (temperature gibi değerleri korumak için)
-        settings = load_settings()
-        if "models" not in settings:
-            settings["models"] = {}
+        # load_settings cache'lenmiş dict'i döndürür; değiştirmeden önce kopyala
+        settings = dict(load_settings())
+        settings["models"] = dict(settings.get("models", {}))
         
         for role in ALL_ROLES:
-            try:
-                provider = self.query_one(f"#provider-{role}", Select).value
-                model = self.query_one(f"#model-{role}", Input).value.strip()
-            except:
-                continue
+            provider = self._selects[role].value
+            model = self._inputs[role].value.strip()
             
             if provider and model:
                 # Mevcut temperature'ı koru
@@ -265,3 +304,10 @@ class ModelSelectorModal(ModalScreen):
         save_settings(settings)
         self.app.notify("✓ Model ayarları kaydedildi!", severity="information")
         self.dismiss(True)
+    
+    # button id -> handler (sınıf tanımında bir kez oluşturulur)
+    _BUTTON_ACTIONS = {
+        "btn-save": _save_settings,
+        "btn-cancel": action_cancel,
+        "btn-close": action_cancel,
+    }
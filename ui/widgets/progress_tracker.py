@@ -3,8 +3,20 @@ Progress Tracker Widget - Görev ilerlemesini görsel olarak gösterir
 """
 from textual.widgets import Static
 from textual.reactive import reactive
+from rich.style import Style
 from rich.text import Text
-from datetime import datetime
+from collections import deque
+import time
+from itertools import islice
+
+
+# TaskProgressWidget'ın tuttuğu en fazla adım sayısı
+MAX_STEPS_HISTORY = 200
+
+
+def _last_items(items: deque, count: int) -> list:
+    """Deque'nun son count elemanı (eski -> yeni), tamamını kopyalamadan"""
+    return list(islice(reversed(items), count))[::-1]
 
 
 class TaskProgressWidget(Static):
@@ -14,19 +26,27 @@ class TaskProgressWidget(Static):
     total_steps = reactive(0)
     current_message = reactive("")
     
+    # Render başına yeniden oluşturulmayan sabitler; bar parçaları dilimlenir
+    _SPINNER = ("⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏")
+    _BAR_WIDTH = 20
+    _BAR_FULL = "█" * _BAR_WIDTH
+    _BAR_EMPTY = "░" * _BAR_WIDTH
+    
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.steps_history = []
+        self.steps_history = deque(maxlen=MAX_STEPS_HISTORY)
         self.start_time = None
+        self._render_timer = None
     
     def start_task(self, task_name: str, total_steps: int = 0):
         """Yeni görev başlat"""
         self.current_step = 0
         self.total_steps = total_steps
         self.current_message = task_name
-        self.steps_history = []
-        self.start_time = datetime.now()
-        self._update_display()
+        self.steps_history.clear()
+        # Geçen süre hesabı için monotonic saniye (duvar saati değil)
+        self.start_time = time.monotonic()
+        self._schedule_render()
     
     def update_step(self, step: int, message: str):
         """Adım güncelle"""
@@ -35,9 +55,9 @@ class TaskProgressWidget(Static):
         self.steps_history.append({
             "step": step,
             "message": message,
-            "time": datetime.now()
+            "time": time.monotonic()
         })
-        self._update_display()
+        self._schedule_render()
     
     def increment_step(self, message: str = ""):
         """Bir sonraki adıma geç"""
@@ -47,21 +67,38 @@ class TaskProgressWidget(Static):
         self.steps_history.append({
             "step": self.current_step,
             "message": message,
-            "time": datetime.now()
+            "time": time.monotonic()
         })
-        self._update_display()
+        self._schedule_render()
     
     def complete_task(self, message: str = "Tamamlandı"):
         """Görevi tamamla"""
         self.current_step = self.total_steps if self.total_steps > 0 else self.current_step
         self.current_message = message
+        self._cancel_render()
         self._update_display(completed=True)
     
     def fail_task(self, error: str):
         """Görev başarısız"""
         self.current_message = f"❌ {error}"
+        self._cancel_render()
         self._update_display(failed=True)
     
+    def _schedule_render(self) -> None:
+        """Art arda gelen adım güncellemelerini 100ms içinde tek bir render'a topla"""
+        if self._render_timer is None:
+            self._render_timer = self.set_timer(0.1, self._flush_render)
+    
+    def _flush_render(self) -> None:
+        self._render_timer = None
+        self._update_display()
+    
+    def _cancel_render(self) -> None:
+        """Bekleyen render'ı iptal et (bitiş durumu hemen ve son olarak çizilir)"""
+        if self._render_timer is not None:
+            self._render_timer.stop()
+            self._render_timer = None
+    
     def _update_display(self, completed: bool = False, failed: bool = False):
         """Görüntüyü güncelle"""
         text = Text()
@@ -69,43 +106,36 @@ class TaskProgressWidget(Static):
         # Progress bar
         if self.total_steps > 0:
             progress = self.current_step / self.total_steps
-            bar_width = 20
-            filled = int(bar_width * progress)
-            empty = bar_width - filled
+            filled = max(0, min(int(self._BAR_WIDTH * progress), self._BAR_WIDTH))
             
             if completed:
-                bar_char = "█"
                 bar_style = "green"
             elif failed:
-                bar_char = "█"
                 bar_style = "red"
             else:
-                bar_char = "█"
                 bar_style = "yellow"
             
             text.append("[", style="dim")
-            text.append(bar_char * filled, style=bar_style)
-            text.append("░" * empty, style="dim")
+            text.append(self._BAR_FULL[:filled], style=bar_style)
+            text.append(self._BAR_EMPTY[filled:], style="dim")
             text.append("]", style="dim")
             text.append(f" {self.current_step}/{self.total_steps}", style="cyan")
         else:
             # Belirsiz progress (spinner tarzı)
-            spinner_chars = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
-            spinner_idx = self.current_step % len(spinner_chars)
-            
             if completed:
                 text.append("✅ ", style="green")
             elif failed:
                 text.append("❌ ", style="red")
             else:
-                text.append(f"{spinner_chars[spinner_idx]} ", style="yellow")
+                spinner = self._SPINNER[self.current_step % len(self._SPINNER)]
+                text.append(f"{spinner} ", style="yellow")
         
         # Mesaj
         text.append(f" {self.current_message}")
         
         # Geçen süre
-        if self.start_time:
-            elapsed = (datetime.now() - self.start_time).total_seconds()
+        if self.start_time is not None:
+            elapsed = time.monotonic() - self.start_time
             if elapsed > 1:
                 text.append(f" ({elapsed:.1f}s)", style="dim")
         
@@ -117,74 +147,93 @@ class TaskProgressWidget(Static):
             return "Henüz adım yok"
         
         lines = ["📋 Görev Özeti:"]
-        for item in self.steps_history[-5:]:  # Son 5 adım
+        for item in _last_items(self.steps_history, 5):  # Son 5 adım
             lines.append(f"  • {item['message']}")
         
-        if self.start_time:
-            elapsed = (datetime.now() - self.start_time).total_seconds()
+        if self.start_time is not None:
+            elapsed = time.monotonic() - self.start_time
             lines.append(f"\n⏱ Toplam süre: {elapsed:.1f}s")
         
         return "\n".join(lines)
 
 
+# ToolActivityWidget satır parçaları (her render'da yeniden stillenmez)
+_ACTIVITY_HEADER = Text("🔧 Tool Aktiviteleri\n", style=Style(color="cyan", bold=True))
+_ACTIVITY_PREFIXES = {
+    "running": Text("  ⚙️ ", style=Style(color="yellow")),
+    "success": Text("  ✅ ", style=Style(color="green")),
+    "error": Text("  ❌ ", style=Style(color="red")),
+}
+_ACTIVITY_PREFIX_DEFAULT = Text("  • ", style=Style(dim=True))
+
+
 class ToolActivityWidget(Static):
     """Tool aktivitelerini gösteren widget"""
     
     def __init__(self, max_items: int = 10, **kwargs):
         super().__init__(**kwargs)
-        self.activities = []
+        self.activities = deque(maxlen=max_items)
         self.max_items = max_items
+        # tool adı -> hâlâ "running" olan kayıtları (eski -> yeni)
+        self._running_by_tool = {}
+        # Son çizilen (tool, status) listesi
+        self._last_sig = None
     
     def add_activity(self, tool_name: str, status: str = "running"):
         """Aktivite ekle"""
         activity = {
             "tool": tool_name,
             "status": status,
-            "time": datetime.now()
+            "time": time.monotonic()
         }
+        # Maksimum sayıyı aşarsa en eskisi deque tarafından düşürülür;
+        # çalışıyor durumundaysa indeksten de çıkar
+        if self.activities and len(self.activities) == self.activities.maxlen:
+            oldest = self.activities[0]
+            running = self._running_by_tool.get(oldest["tool"])
+            if running and running[0] is oldest:
+                running.popleft()
+                if not running:
+                    del self._running_by_tool[oldest["tool"]]
         self.activities.append(activity)
-        
-        # Maksimum sayıyı aşarsa eski olanları sil
-        if len(self.activities) > self.max_items:
-            self.activities = self.activities[-self.max_items:]
+        if status == "running":
+            self._running_by_tool.setdefault(tool_name, deque()).append(activity)
         
         self._update_display()
     
     def update_activity(self, tool_name: str, status: str):
         """Aktivite durumunu güncelle"""
-        for activity in reversed(self.activities):
-            if activity["tool"] == tool_name and activity["status"] == "running":
-                activity["status"] = status
-                break
+        # En son başlayan "running" kaydı; dict deque'daki kaydın kendisi
+        running = self._running_by_tool.get(tool_name)
+        if running:
+            running.pop()["status"] = status
+            if not running:
+                del self._running_by_tool[tool_name]
         self._update_display()
     
     def clear(self):
         """Aktiviteleri temizle"""
-        self.activities = []
+        self.activities.clear()
+        self._running_by_tool.clear()
         self._update_display()
     
     def _update_display(self):
-        """Görüntüyü güncelle"""
-        if not self.activities:
+        """Görüntüyü güncelle (son 5 aktivite değişmediyse yeniden çizme)"""
+        recent = _last_items(self.activities, 5)  # Son 5 aktivite
+        sig = tuple((activity["tool"], activity["status"]) for activity in recent)
+        if sig == self._last_sig:
+            return
+        self._last_sig = sig
+        
+        if not recent:
             self.update("[dim]Aktivite yok[/dim]")
             return
         
         text = Text()
-        text.append("🔧 Tool Aktiviteleri\n", style="bold cyan")
+        text.append_text(_ACTIVITY_HEADER)
         
-        for activity in self.activities[-5:]:  # Son 5 aktivite
-            status = activity["status"]
-            tool = activity["tool"]
-            
-            if status == "running":
-                text.append("  ⚙️ ", style="yellow")
-            elif status == "success":
-                text.append("  ✅ ", style="green")
-            elif status == "error":
-                text.append("  ❌ ", style="red")
-            else:
-                text.append("  • ", style="dim")
-            
+        for tool, status in sig:
+            text.append_text(_ACTIVITY_PREFIXES.get(status, _ACTIVITY_PREFIX_DEFAULT))
             text.append(f"{tool}\n")
         
         self.update(text)
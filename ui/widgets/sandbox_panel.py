@@ -6,6 +6,7 @@ from textual.containers import Vertical, Horizontal, VerticalScroll
 from textual.widgets import Button, Static, Label, RichLog
 from textual.widget import Widget
 from textual.message import Message
+from rich.style import Style
 from rich.text import Text
 
 from tools.sandbox import (
@@ -17,6 +18,38 @@ from utils.logger import get_logger
 
 logger = get_logger()
 
+# Giriş stilleri bir kez oluşturulur; her satırda stil metni çözümlenmez
+_STYLE_DIM = Style(dim=True)
+_STYLE_CMD = Style(color="green", bold=True)
+_STYLE_OUT = Style(color="white")
+_STYLE_ERR = Style(color="red")
+_STYLE_SYS = Style(color="yellow", italic=True)
+
+
+def _format_entry(entry: dict):
+    """Terminal girişini Text'e çevir (bilinmeyen tür için None)"""
+    timestamp = entry.get("timestamp", "")
+    content = entry.get("content", "")
+    entry_type = entry.get("type", "output")
+    
+    if entry_type == "command":
+        # Komut - yeşil (zaman damgası ayrı satırda)
+        return Text.assemble((f"[{timestamp}] ", _STYLE_DIM), "\n", (content, _STYLE_CMD))
+    
+    elif entry_type == "output":
+        # Normal çıktı
+        return Text(content, style=_STYLE_OUT)
+    
+    elif entry_type == "error":
+        # Hata - kırmızı
+        return Text(content, style=_STYLE_ERR)
+    
+    elif entry_type == "system":
+        # Sistem mesajı - sarı
+        return Text(f"[{timestamp}] {content}", style=_STYLE_SYS)
+    
+    return None
+
 
 class SandboxTerminal(RichLog):
     """Sandbox terminal çıktısını gösteren widget"""
@@ -35,6 +68,11 @@ class SandboxPanel(Vertical):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._terminal: SandboxTerminal = None
+        self._status: Static = None
+        self._btn_start: Button = None
+        self._btn_stop: Button = None
+        # Son gösterilen çalışma durumu (None: henüz gösterilmedi)
+        self._last_running = None
     
     def compose(self) -> ComposeResult:
         with Horizontal(id="sandbox-header"):
@@ -53,6 +91,9 @@ class SandboxPanel(Vertical):
     
     def on_mount(self) -> None:
         self._terminal = self.query_one("#sandbox-terminal", SandboxTerminal)
+        self._status = self.query_one("#sandbox-status-indicator", Static)
+        self._btn_start = self.query_one("#btn-sandbox-start", Button)
+        self._btn_stop = self.query_one("#btn-sandbox-stop", Button)
         
         # Terminal callback kaydet
         register_terminal_callback(self._on_terminal_update)
@@ -78,47 +119,33 @@ class SandboxPanel(Vertical):
         if not self._terminal:
             return
         
-        timestamp = entry.get("timestamp", "")
-        content = entry.get("content", "")
-        entry_type = entry.get("type", "output")
-        
-        if entry_type == "command":
-            # Komut - yeşil
-            self._terminal.write(Text(f"[{timestamp}] ", style="dim"))
-            self._terminal.write(Text(content, style="bold green"))
-        
-        elif entry_type == "output":
-            # Normal çıktı
-            self._terminal.write(Text(content, style="white"))
-        
-        elif entry_type == "error":
-            # Hata - kırmızı
-            self._terminal.write(Text(content, style="red"))
-        
-        elif entry_type == "system":
-            # Sistem mesajı - sarı
-            self._terminal.write(Text(f"[{timestamp}] {content}", style="yellow italic"))
+        text = _format_entry(entry)
+        if text is not None:
+            self._terminal.write(text)
     
     def _load_history(self):
-        """Mevcut history'i yükle"""
-        history = get_terminal_history()
-        for entry in history:
-            self._write_entry(entry)
+        """Mevcut history'i yükle (tüm girişler tek write ile)"""
+        if not self._terminal:
+            return
+        
+        texts = [text for text in map(_format_entry, get_terminal_history()) if text is not None]
+        if texts:
+            self._terminal.write(Text("\n").join(texts))
     
-    def _update_status(self):
-        """Sandbox durumunu güncelle"""
+    def _update_status(self, force: bool = False):
+        """Sandbox durumunu güncelle (durum değişmediyse widget'lara dokunma)"""
         try:
-            info = get_sandbox_info()
-            status = self.query_one("#sandbox-status-indicator", Static)
+            running = bool(get_sandbox_info()["running"])
+            if running == self._last_running and not force:
+                return
+            self._last_running = running
             
-            if info["running"]:
-                status.update("[green]● Çalışıyor[/green]")
-                self.query_one("#btn-sandbox-start", Button).disabled = True
-                self.query_one("#btn-sandbox-stop", Button).disabled = False
+            if running:
+                self._status.update("[green]● Çalışıyor[/green]")
             else:
-                status.update("[red]● Durdurulmuş[/red]")
-                self.query_one("#btn-sandbox-start", Button).disabled = False
-                self.query_one("#btn-sandbox-stop", Button).disabled = True
+                self._status.update("[red]● Durdurulmuş[/red]")
+            self._btn_start.disabled = running
+            self._btn_stop.disabled = not running
         except Exception as e:
             logger.error(f"Status update error: {e}")
     
@@ -136,13 +163,14 @@ class SandboxPanel(Vertical):
     
     async def _start_sandbox(self):
         """Sandbox başlat"""
-        self.query_one("#sandbox-status-indicator", Static).update("[yellow]⏳ Başlatılıyor...[/yellow]")
+        self._status.update("[yellow]⏳ Başlatılıyor...[/yellow]")
         self.app.notify("Sandbox başlatılıyor...", severity="information")
         
         # Tool'u çağır
         result = sandbox_start.invoke({})
         
-        self._update_status()
+        # Ara metin yazıldı; durum aynı kalsa da yeniden çiz
+        self._update_status(force=True)
         
         if "✓" in result:
             self.app.notify("Sandbox hazır!", severity="information")
@@ -151,11 +179,12 @@ class SandboxPanel(Vertical):
     
     async def _stop_sandbox(self):
         """Sandbox durdur"""
-        self.query_one("#sandbox-status-indicator", Static).update("[yellow]⏳ Durduruluyor...[/yellow]")
+        self._status.update("[yellow]⏳ Durduruluyor...[/yellow]")
         
         result = sandbox_stop.invoke({})
         
-        self._update_status()
+        # Ara metin yazıldı; durum aynı kalsa da yeniden çiz
+        self._update_status(force=True)
         
         if "✓" in result:
             self.app.notify("Sandbox durduruldu", severity="information")
@@ -3,57 +3,94 @@ Sandbox File Tree - Docker container dosya gezgini
 """
 from textual.widgets import Tree
 from textual.widgets.tree import TreeNode
+from rich.style import Style
 from rich.text import Text
+import asyncio
 import json
 import os
+from functools import lru_cache
 
 from tools.sandbox import sandbox_list_files
 from utils.logger import get_logger
 
 logger = get_logger()
 
+# Uzantı -> ikon
+_ICONS = {
+    ".py": "🐍",
+    ".js": "📜",
+    ".html": "🌐",
+    ".css": "🎨",
+    ".json": "{}",
+    ".md": "📝",
+    ".txt": "📄",
+    ".sh": "🐚",
+    ".dockerfile": "🐳",
+    ".yml": "⚙️",
+    ".yaml": "⚙️"
+}
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+# Node etiket stilleri (her dosyada stil metni çözümlenmez)
+_STYLE_DIR = Style(color="yellow", bold=True)
+_STYLE_FILE = Style(color="white")
+_STYLE_DIM = Style(dim=True)
+
 class SandboxTree(Tree):
     """Docker container içindeki dosyaları gösteren ağaç yapısı"""
     
     def __init__(self, path: str = "/home/agent", **kwargs):
         super().__init__("🐳 Sandbox Home", data="/home/agent", **kwargs)
         self.root.expand()
+        # Listesi arka planda alınmakta olan node id'leri
+        self._loading = set()
         
     def on_mount(self) -> None:
-        self._load_directory(self.root, "/home/agent")
+        self.run_worker(self._load_directory(self.root, "/home/agent"))
         
-    def _load_directory(self, node: TreeNode, path: str):
+    @staticmethod
+    def _fetch_listing(path: str) -> list:
+        """Dizin listesini backend'den al (docker exec; worker thread'de çalışır)"""
+        return json.loads(sandbox_list_files.invoke({"path": path}))
+        
+    async def _load_directory(self, node: TreeNode, path: str):
         """Dizini yükle ve node'a ekle"""
         try:
-            # Backend'den dosyaları al
-            result = sandbox_list_files.invoke({"path": path})
-            items = json.loads(result)
-            
-            # Klasörleri önce, dosyaları sonra sırala
-            items.sort(key=lambda x: (not x["is_dir"], x["name"].lower()))
-            
-            for item in items:
-                name = item["name"]
-                full_path = item["path"]
-                is_dir = item["is_dir"]
-                
-                if is_dir:
-                    # Klasör
-                    label = Text(f"📁 {name}", style="bold yellow")
-                    child = node.add(label, data=full_path, expand=False)
-                    # Boş bir dummy node ekle ki genişletilebilir görünsün
-                    child.add("Loading...", data=None)
-                else:
-                    # Dosya
-                    icon = self._get_icon(name)
-                    size_str = self._format_size(item.get("size", 0))
-                    label = Text(f"{icon} {name} ", style="white")
-                    label.append(f"({size_str})", style="dim")
-                    node.add_leaf(label, data=full_path)
-                    
+            # docker exec UI thread'ini bloklamasın
+            items = await asyncio.to_thread(self._fetch_listing, path)
+            # "Loading..." yer tutucusu liste gelene kadar görünür kalır;
+            # tüm eklemeler tek ekran güncellemesinde çizilir
+            with self.app.batch_update():
+                node.remove_children()
+                self._populate_node(node, items)
         except Exception as e:
             logger.error(f"SandboxTree load error: {e}")
+            node.remove_children()
             node.add_leaf(f"Error: {e}")
+        finally:
+            self._loading.discard(node.id)
+        
+    def _populate_node(self, node: TreeNode, items: list):
+        """Liste öğelerini node'a ekle (UI thread'inde)"""
+        # Liste sandbox tarafında sıralı gelir (klasörler önce)
+        for item in items:
+            name = item["name"]
+            full_path = item["path"]
+            is_dir = item["is_dir"]
+            
+            if is_dir:
+                # Klasör
+                label = Text(f"📁 {name}", style=_STYLE_DIR)
+                child = node.add(label, data=full_path, expand=False)
+                # Boş bir dummy node ekle ki genişletilebilir görünsün
+                child.add("Loading...", data=None)
+            else:
+                # Dosya
+                icon = self._get_icon(name)
+                size_str = self._format_size(item.get("size", 0))
+                label = Text.assemble(f"{icon} {name} ", (f"({size_str})", _STYLE_DIM), style=_STYLE_FILE)
+                node.add_leaf(label, data=full_path)
 
     def on_tree_node_expanded(self, event: Tree.NodeExpanded) -> None:
         """Klasör genişletildiğinde içeriğini yükle"""
@@ -63,36 +100,24 @@ class SandboxTree(Tree):
         if not path or node.is_root:
             return
             
-        # Eğer zaten yüklendiyse (dummy node yoksa) tekrar yükleme
+        # Eğer zaten yüklendiyse (dummy node yoksa) ya da yükleniyorsa tekrar yükleme
         # Label bir Text objesi olabilir, string'e çevir
-        if len(node.children) == 1:
+        if len(node.children) == 1 and node.id not in self._loading:
             child_label = str(node.children[0].label)
             if "Loading" in child_label:
-                node.remove_children()
-                self._load_directory(node, path)
+                self._loading.add(node.id)
+                self.run_worker(self._load_directory(node, path))
 
-    def _get_icon(self, filename: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _get_icon(filename: str) -> str:
         """Dosya uzantısına göre ikon döndür"""
-        ext = os.path.splitext(filename)[1].lower()
-        icons = {
-            ".py": "🐍",
-            ".js": "📜",
-            ".html": "🌐",
-            ".css": "🎨",
-            ".json": "{}",
-            ".md": "📝",
-            ".txt": "📄",
-            ".sh": "🐚",
-            ".dockerfile": "🐳",
-            ".yml": "⚙️",
-            ".yaml": "⚙️"
-        }
-        return icons.get(ext, "📄")
+        return _ICONS.get(os.path.splitext(filename)[1].lower(), "📄")
 
     def _format_size(self, size: int) -> str:
         """Dosya boyutunu formatla"""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size < 1024:
-                return f"{size:.1f}{unit}"
-            size /= 1024
-        return f"{size:.1f}TB"
+        if size < 1024:
+            return f"{size:.1f}B"
+        # Birim = 1024'ün kuvveti; bit uzunluğundan döngüsüz bulunur
+        idx = min((int(size).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+        return f"{size / (1 << (10 * idx)):.1f}{_SIZE_UNITS[idx]}"
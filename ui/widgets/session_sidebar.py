@@ -9,6 +9,7 @@ from textual.reactive import reactive
 from textual.message import Message
 from rich.text import Text
 from datetime import datetime
+from functools import lru_cache
 
 from core.session_manager import session_manager, Session
 from utils.logger import get_logger
@@ -16,6 +17,15 @@ from utils.logger import get_logger
 logger = get_logger()
 
 
+@lru_cache(maxsize=256)
+def _format_updated(updated_at: str) -> str:
+    """ISO tarihini "gün/ay saat:dakika" olarak formatla; aynı değer tekrar parse edilmez"""
+    try:
+        return datetime.fromisoformat(updated_at).strftime("%d/%m %H:%M")
+    except:
+        return "?"
+
+
 class SessionItem(Vertical):
     """Tek bir session item'ı"""
     
@@ -45,11 +55,7 @@ class SessionItem(Vertical):
             title += "..."
         
         # Tarihi formatla
-        try:
-            dt = datetime.fromisoformat(self.session.updated_at)
-            date_str = dt.strftime("%d/%m %H:%M")
-        except:
-            date_str = "?"
+        date_str = _format_updated(self.session.updated_at)
         
         # Basit layout - tek satırda başlık ve silme butonu
         with Horizontal(classes="session-row"):
@@ -102,6 +108,12 @@ class SessionSidebar(Vertical):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.sessions: list[Session] = []
+        # session.id -> ((title, updated_at, message_count), SessionItem)
+        self._item_cache: dict[str, tuple[tuple, SessionItem]] = {}
+        # active class'ı taşıyan item (session değişince yalnızca o güncellenir)
+        self._active_item: SessionItem | None = None
+        # Son _render_sessions çağrısındaki _render_sig() (None: henüz render yok)
+        self._last_render_sig = None
     
     def compose(self) -> ComposeResult:
         yield Label("📚 Sohbetler", id="sidebar-header")
@@ -123,8 +135,18 @@ class SessionSidebar(Vertical):
         """Session listesini yenile"""
         self.sessions = session_manager.list_sessions(limit=limit)
         logger.info(f"Sidebar refresh: {len(self.sessions)} sessions loaded")
+        # Liste ve aktif session son render'dakiyle aynıysa yeniden render etme
+        if self._render_sig() == self._last_render_sig:
+            return
         self._render_sessions()
     
+    def _render_sig(self) -> tuple:
+        """Render edilen içeriğin imzası (session alanları + aktif session)"""
+        return (
+            self.active_session_id,
+            tuple((s.id, s.updated_at, s.message_count, s.title) for s in self.sessions),
+        )
+    
     def _render_sessions(self):
         """Session'ları render et"""
         logger.info(f"_render_sessions called with {len(self.sessions)} sessions")
@@ -135,19 +157,67 @@ class SessionSidebar(Vertical):
             logger.error(f"Cannot find #session-list: {e}")
             return
         
-        session_list.remove_children()
+        self._last_render_sig = self._render_sig()
         
         if not self.sessions:
             logger.info("Sidebar render: No sessions to display")
+            self._item_cache.clear()
+            self._active_item = None
+            session_list.remove_children()
             session_list.mount(Static("[dim]Henüz sohbet yok[/dim]", classes="no-sessions"))
             return
         
         logger.info(f"Sidebar render: Rendering {len(self.sessions)} sessions")
+        # Başlığı, tarihi ve mesaj sayısı değişmeyen session'ların widget'ı yeniden kullanılır
+        item_cache = {}
+        items = []
+        active_item = None
         for i, session in enumerate(self.sessions):
             is_active = session.id == self.active_session_id
             logger.info(f"  [{i}] {session.id}: {session.title[:20]}")
-            item = SessionItem(session, is_active=is_active)
-            session_list.mount(item)
+            key = (session.title, session.updated_at, session.message_count)
+            cached = self._item_cache.get(session.id)
+            if cached is not None and cached[0] == key:
+                item = cached[1]
+                item.session = session
+                item.is_active = is_active
+                item.set_class(is_active, "active")
+                is_new = False
+            else:
+                item = SessionItem(session, is_active=is_active)
+                is_new = True
+            item_cache[session.id] = (key, item)
+            items.append((item, is_new))
+            if is_active:
+                active_item = item
+        self._item_cache = item_cache
+        self._active_item = active_item
+        
+        # Kaldırma, mount ve sıralama tek ekran güncellemesinde çizilir
+        with self.app.batch_update():
+            # Listede kalmayan (silinmiş, değişmiş veya "sohbet yok") widget'ları kaldır
+            keep = {item for item, _ in items}
+            stale = [child for child in session_list.children if child not in keep]
+            if stale:
+                session_list.remove_children(stale)
+            
+            # Yeni item'ları yerine mount et, yeniden kullanılanları gerekiyorsa sırala
+            prev = None
+            for item, is_new in items:
+                children = session_list.children
+                if is_new:
+                    if prev is not None:
+                        session_list.mount(item, after=prev)
+                    elif children:
+                        session_list.mount(item, before=0)
+                    else:
+                        session_list.mount(item)
+                elif prev is None:
+                    if children[0] is not item:
+                        session_list.move_child(item, before=0)
+                elif children.index(item) != children.index(prev) + 1:
+                    session_list.move_child(item, after=prev)
+                prev = item
     
     def set_active_session(self, session_id: str, refresh: bool = True):
         """Aktif session'ı ayarla"""
@@ -188,9 +258,14 @@ class SessionSidebar(Vertical):
     
     def watch_active_session_id(self, new_id: str) -> None:
         """Aktif session değiştiğinde"""
-        # Tüm item'ların active class'ını güncelle
-        for item in self.query(SessionItem):
-            if item.session.id == new_id:
-                item.add_class("active")
-            else:
-                item.remove_class("active")
+        # Yalnızca eski ve yeni aktif item'ın class'ını güncelle
+        cached = self._item_cache.get(new_id)
+        new_item = cached[1] if cached is not None else None
+        old_item = self._active_item
+        if old_item is not None and old_item is not new_item:
+            old_item.is_active = False
+            old_item.remove_class("active")
+        if new_item is not None:
+            new_item.is_active = True
+            new_item.add_class("active")
+        self._active_item = new_item
@@ -93,7 +93,7 @@ class AtomLogger:
     
     def tool_end(self, tool_name: str, agent: str = "", output_preview: str = ""):
         """Tool bitişini logla"""
-        preview = output_preview[:200] + "..." if len(output_preview) > 200 else output_preview
+        preview = f"{output_preview[:200]}..." if len(output_preview) > 200 else output_preview
         self.info(f"✅ TOOL_END | {agent}/{tool_name} | output={preview}")
     
     def agent_route(self, from_agent: str, to_agent: str, reason: str = ""):
@@ -106,7 +106,7 @@ class AtomLogger:
     
     def agent_response(self, agent: str, response: str):
         """Agent yanıtını logla"""
-        preview = response[:200] + "..." if len(response) > 200 else response
+        preview = f"{response[:200]}..." if len(response) > 200 else response
         self.info(f"🤖 {agent} | {preview}")
 
 def log_execution(func):